@@ -3,7 +3,8 @@ SQLAlchemy models for the Investor Database
 Compatible with both SQLite and MySQL
 """
 
-from sqlalchemy import Column, String, Text, Float, Integer, DateTime, Index
+from sqlalchemy import Column, String, Text, Float, Integer, DateTime, Index, select
+from sqlalchemy.orm import column_property
 from datetime import datetime
 from database.db import Base
 
@@ -12,8 +13,8 @@ class Fund(Base):
     """
     Fund model for storing investment fund information in the database.
 
-    Stores fund details including AUM (both raw string and parsed numeric value),
-    strategy, and portfolio relationships.
+    Stores fund details including AUM (numeric; the '$500M' display string is
+    derived in the API schemas), strategy, and portfolio relationships.
     """
     __tablename__ = "funds"
 
@@ -24,7 +25,6 @@ class Fund(Base):
 
     # Fund details
     founded_year = Column(Integer, nullable=True)
-    aum_raw = Column(String(50), nullable=True)  # e.g., "$500M"
     aum = Column(Float, nullable=True, index=True)  # e.g., 500000000.0
     strategy = Column(String(100), nullable=True, index=True)  # e.g., "Growth Equity", "Venture Capital"
 
@@ -50,7 +50,7 @@ class LP(Base):
     Limited Partner (LP) model for storing investor information.
 
     Tracks LPs, their details, and relationships with funds.
-    Stores both raw string values and parsed numeric values for commitment amounts.
+    Money amounts are stored as numbers only; display strings are derived on output.
     """
     __tablename__ = "lps"
 
@@ -70,7 +70,6 @@ class LP(Base):
     location = Column(String(255), nullable=True, index=True)  # City, Country
 
     # Investment details
-    total_committed_capital_raw = Column(String(50), nullable=True)  # e.g., "$50M"
     total_committed_capital = Column(Float, nullable=True, index=True)  # e.g., 50000000.0
     investment_focus = Column(String(500), nullable=True)  # e.g., "Technology, Healthcare"
     first_investment_year = Column(Integer, nullable=True)
@@ -101,12 +100,10 @@ class LPFundCommitment(Base):
     fund_id = Column(String(36), nullable=False, index=True)  # Foreign key to funds.id
 
     # Commitment details
-    commitment_amount_raw = Column(String(50), nullable=True)  # e.g., "$10M"
     commitment_amount = Column(Float, nullable=True)  # e.g., 10000000.0
     commitment_date = Column(DateTime, nullable=True)
 
     # Capital called
-    capital_called_raw = Column(String(50), nullable=True)  # e.g., "$7M"
     capital_called = Column(Float, nullable=True)  # e.g., 7000000.0
 
     notes = Column(Text, nullable=True)
@@ -144,17 +141,10 @@ class LPHolding(Base):
     # Fund details
     vintage = Column(Integer, nullable=True, index=True)  # Fund vintage year
 
-    # Capital flows - raw string and parsed numeric
-    capital_committed_raw = Column(String(50), nullable=True)  # e.g., "$50M"
+    # Capital flows (display strings are derived on output)
     capital_committed = Column(Float, nullable=True, index=True)  # e.g., 50000000.0
-
-    capital_contributed_raw = Column(String(50), nullable=True)  # e.g., "$35M"
     capital_contributed = Column(Float, nullable=True)  # e.g., 35000000.0
-
-    capital_distributed_raw = Column(String(50), nullable=True)  # e.g., "$20M"
     capital_distributed = Column(Float, nullable=True)  # e.g., 20000000.0
-
-    market_value_raw = Column(String(50), nullable=True)  # e.g., "$45M"
     market_value = Column(Float, nullable=True, index=True)  # e.g., 45000000.0
 
     # Performance metrics
@@ -192,7 +182,11 @@ class PortfolioCompany(Base):
     # Primary fields
     id = Column(String(36), primary_key=True)  # UUID as string
     fund_id = Column(String(36), nullable=False, index=True)  # Foreign key to funds.id
-    fund_name = Column(String(255), nullable=True)  # Denormalized fund name for display
+
+    # Fund name for display, looked up from funds in the same SELECT rather than stored per row
+    fund_name = column_property(
+        select(Fund.name).where(Fund.id == fund_id).correlate_except(Fund).scalar_subquery()
+    )
 
     # Company details
     name = Column(String(255), nullable=False, index=True)
@@ -205,7 +199,6 @@ class PortfolioCompany(Base):
 
     # Investment details
     investment_date = Column(DateTime, nullable=True)
-    valuation_raw = Column(String(50), nullable=True)  # e.g., "$2.5B"
     valuation = Column(Float, nullable=True, index=True)  # e.g., 2500000000.0
 
     # Status
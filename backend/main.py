@@ -27,14 +27,15 @@ from schemas.fund import (
     FundCreate,
     FundUpdate,
     FundResponse,
-    FundListResponse
+    FundListResponse,
+    FUND_LIST_RESPONSE_ADAPTER
 )
 from schemas.lp import (
     LPCreate,
     LPUpdate,
     LPResponse,
     LPListResponse,
-    LPSearchFilters,
+    LP_LIST_RESPONSE_ADAPTER,
     LPTypesResponse,
     LPStatistics,
     LPFundCommitmentCreate,
@@ -45,11 +46,14 @@ from schemas.portfolio_company import (
     PortfolioCompanyCreate,
     PortfolioCompanyUpdate,
     PortfolioCompanyResponse,
-    PortfolioCompanyListResponse
+    PortfolioCompanyListResponse,
+    PORTFOLIO_COMPANY_LIST_RESPONSE_ADAPTER
 )
+from schemas.utils import orjson_response
+from utils.money import format_money
 
 # Import secondary funds router
-from secondary_funds import secondary_funds_router
+from secondary_funds import secondary_funds_router, load_secondary_search_tables
 
 # Import Preqin data layer router
 try:
@@ -138,6 +142,7 @@ async def startup_event():
     """Initialize database on startup"""
     logger.info("Starting up Investor Database Service...")
     init_database()
+    load_secondary_search_tables()
     logger.info("Database initialized successfully")
 
 @app.get("/")
@@ -390,6 +395,16 @@ async def get_research(session_id: str):
     return ResearchSession(**research_sessions[session_id])
 
 
+def orm_to_response(schema, row):
+    """
+    Build a response schema from an ORM row read back from our own database.
+
+    The row was validated on write, so its column values are copied straight
+    into the model with model_construct instead of being re-validated.
+    """
+    return schema.model_construct(**{attr.key: getattr(row, attr.key) for attr in row.__mapper__.column_attrs})
+
+
 # ============================================================================
 # Fund API Endpoints
 # ============================================================================
@@ -402,7 +417,7 @@ async def create_fund(
     """Create a new fund"""
     try:
         db_fund = Fund(
-            id=str(uuid4()),
+            id=uuid4().hex,
             **fund.model_dump()
         )
 
@@ -431,7 +446,7 @@ async def get_fund(
         if not fund:
             raise HTTPException(status_code=404, detail="Fund not found")
 
-        return FundResponse.model_validate(fund)
+        return orm_to_response(FundResponse, fund)
 
     except HTTPException:
         raise
@@ -502,8 +517,8 @@ async def list_funds(
     db: Session = Depends(get_db),
     search: Optional[str] = Query(None, description="Search in fund name and description"),
     strategy: Optional[str] = Query(None, description="Filter by investment strategy"),
-    min_aum: Optional[float] = Query(None, description="Minimum AUM"),
-    max_aum: Optional[float] = Query(None, description="Maximum AUM"),
+    min_aum: Optional[float] = Query(None, ge=0, description="Minimum AUM"),
+    max_aum: Optional[float] = Query(None, ge=0, description="Maximum AUM"),
     headquarters: Optional[str] = Query(None, description="Filter by headquarters location"),
     min_founded_year: Optional[int] = Query(None, description="Minimum founding year"),
     max_founded_year: Optional[int] = Query(None, description="Maximum founding year"),
@@ -564,15 +579,13 @@ async def list_funds(
 
         page_size = limit
         current_page = (offset // limit) + 1 if limit > 0 else 1
-        total_pages = (total + limit - 1) // limit if limit > 0 else 1
 
-        return FundListResponse(
-            funds=[FundResponse.model_validate(f) for f in funds],
+        return orjson_response(FUND_LIST_RESPONSE_ADAPTER, FundListResponse(
+            funds=[orm_to_response(FundResponse, row) for row in funds],
             total=total,
             page=current_page,
-            page_size=page_size,
-            total_pages=total_pages
-        )
+            page_size=page_size
+        ))
 
     except Exception as e:
         logger.error(f"Failed to list funds: {e}")
@@ -642,8 +655,8 @@ async def list_lps(
     location: Optional[str] = Query(None, description="Filter by location"),
     relationship_status: Optional[str] = Query(None, description="Filter by relationship status"),
     tier: Optional[str] = Query(None, description="Filter by tier"),
-    min_commitment: Optional[float] = Query(None, description="Minimum committed capital"),
-    max_commitment: Optional[float] = Query(None, description="Maximum committed capital"),
+    min_commitment: Optional[float] = Query(None, ge=0, description="Minimum committed capital"),
+    max_commitment: Optional[float] = Query(None, ge=0, description="Maximum committed capital"),
     min_investment_year: Optional[int] = Query(None, description="Minimum first investment year"),
     max_investment_year: Optional[int] = Query(None, description="Maximum first investment year"),
     sort_by: str = Query("name", description="Field to sort by"),
@@ -703,15 +716,13 @@ async def list_lps(
         lps = query.all()
 
         page = (offset // limit) + 1
-        total_pages = (total + limit - 1) // limit
 
-        return LPListResponse(
-            lps=[LPResponse.model_validate(lp) for lp in lps],
+        return orjson_response(LP_LIST_RESPONSE_ADAPTER, LPListResponse(
+            lps=[orm_to_response(LPResponse, row) for row in lps],
             total=total,
             page=page,
-            page_size=limit,
-            total_pages=total_pages
-        )
+            page_size=limit
+        ))
 
     except Exception as e:
         logger.error(f"Failed to list LPs: {e}")
@@ -730,7 +741,7 @@ async def get_lp(
         if not lp:
             raise HTTPException(status_code=404, detail="LP not found")
 
-        return LPResponse.model_validate(lp)
+        return orm_to_response(LPResponse, lp)
 
     except HTTPException:
         raise
@@ -750,7 +761,7 @@ async def create_lp(
         if existing:
             raise HTTPException(status_code=400, detail="LP with this name already exists")
 
-        lp_id = str(uuid4())
+        lp_id = uuid4().hex
         new_lp = LP(id=lp_id, **lp.model_dump())
 
         db.add(new_lp)
@@ -944,10 +955,10 @@ async def list_lp_commitments(
                 "fund_id": commitment.fund_id,
                 "fund_name": fund_name,
                 "fund_strategy": fund_strategy,
-                "commitment_amount_raw": commitment.commitment_amount_raw,
+                "commitment_amount_raw": format_money(commitment.commitment_amount),
                 "commitment_amount": commitment.commitment_amount,
                 "commitment_date": commitment.commitment_date,
-                "capital_called_raw": commitment.capital_called_raw,
+                "capital_called_raw": format_money(commitment.capital_called),
                 "capital_called": commitment.capital_called,
                 "capital_called_percentage": capital_called_percentage,
                 "notes": commitment.notes,
@@ -990,7 +1001,7 @@ async def create_lp_commitment(
         if existing:
             raise HTTPException(status_code=400, detail="Commitment already exists for this LP and fund")
 
-        commitment_id = str(uuid4())
+        commitment_id = uuid4().hex
         new_commitment = LPFundCommitment(id=commitment_id, **commitment.model_dump())
 
         db.add(new_commitment)
@@ -1135,13 +1146,13 @@ async def get_holdings(
                 "fund_name": holding.fund_name,
                 "vintage": holding.vintage,
                 "capital_committed": holding.capital_committed,
-                "capital_committed_raw": holding.capital_committed_raw,
+                "capital_committed_raw": format_money(holding.capital_committed),
                 "capital_contributed": holding.capital_contributed,
-                "capital_contributed_raw": holding.capital_contributed_raw,
+                "capital_contributed_raw": format_money(holding.capital_contributed),
                 "capital_distributed": holding.capital_distributed,
-                "capital_distributed_raw": holding.capital_distributed_raw,
+                "capital_distributed_raw": format_money(holding.capital_distributed),
                 "market_value": holding.market_value,
-                "market_value_raw": holding.market_value_raw,
+                "market_value_raw": format_money(holding.market_value),
                 "inception_irr": holding.inception_irr,
                 "lp_id": holding.lp_id,
                 "lp_name": holding.lp_name,
@@ -1176,13 +1187,13 @@ async def get_holding(holding_id: str, db: Session = Depends(get_db)):
             "fund_name": holding.fund_name,
             "vintage": holding.vintage,
             "capital_committed": holding.capital_committed,
-            "capital_committed_raw": holding.capital_committed_raw,
+            "capital_committed_raw": format_money(holding.capital_committed),
             "capital_contributed": holding.capital_contributed,
-            "capital_contributed_raw": holding.capital_contributed_raw,
+            "capital_contributed_raw": format_money(holding.capital_contributed),
             "capital_distributed": holding.capital_distributed,
-            "capital_distributed_raw": holding.capital_distributed_raw,
+            "capital_distributed_raw": format_money(holding.capital_distributed),
             "market_value": holding.market_value,
-            "market_value_raw": holding.market_value_raw,
+            "market_value_raw": format_money(holding.market_value),
             "inception_irr": holding.inception_irr,
             "lp_id": holding.lp_id,
             "lp_name": holding.lp_name,
@@ -1201,7 +1212,7 @@ async def get_holding(holding_id: str, db: Session = Depends(get_db)):
 async def create_holding(holding_data: dict, db: Session = Depends(get_db)):
     """Create a new holding"""
     try:
-        holding_id = str(uuid4())
+        holding_id = uuid4().hex
 
         holding = LPHolding(
             id=holding_id,
@@ -1209,13 +1220,9 @@ async def create_holding(holding_data: dict, db: Session = Depends(get_db)):
             fund_name=holding_data["fund_name"],
             vintage=holding_data.get("vintage"),
             capital_committed=holding_data.get("capital_committed"),
-            capital_committed_raw=holding_data.get("capital_committed_raw"),
             capital_contributed=holding_data.get("capital_contributed"),
-            capital_contributed_raw=holding_data.get("capital_contributed_raw"),
             capital_distributed=holding_data.get("capital_distributed"),
-            capital_distributed_raw=holding_data.get("capital_distributed_raw"),
             market_value=holding_data.get("market_value"),
-            market_value_raw=holding_data.get("market_value_raw"),
             inception_irr=holding_data.get("inception_irr"),
             lp_id=holding_data.get("lp_id"),
             lp_name=holding_data.get("lp_name"),
@@ -1235,13 +1242,13 @@ async def create_holding(holding_data: dict, db: Session = Depends(get_db)):
             "fund_name": holding.fund_name,
             "vintage": holding.vintage,
             "capital_committed": holding.capital_committed,
-            "capital_committed_raw": holding.capital_committed_raw,
+            "capital_committed_raw": format_money(holding.capital_committed),
             "capital_contributed": holding.capital_contributed,
-            "capital_contributed_raw": holding.capital_contributed_raw,
+            "capital_contributed_raw": format_money(holding.capital_contributed),
             "capital_distributed": holding.capital_distributed,
-            "capital_distributed_raw": holding.capital_distributed_raw,
+            "capital_distributed_raw": format_money(holding.capital_distributed),
             "market_value": holding.market_value,
-            "market_value_raw": holding.market_value_raw,
+            "market_value_raw": format_money(holding.market_value),
             "inception_irr": holding.inception_irr,
             "lp_id": holding.lp_id,
             "lp_name": holding.lp_name,
@@ -1285,13 +1292,13 @@ async def update_holding(
             "fund_name": holding.fund_name,
             "vintage": holding.vintage,
             "capital_committed": holding.capital_committed,
-            "capital_committed_raw": holding.capital_committed_raw,
+            "capital_committed_raw": format_money(holding.capital_committed),
             "capital_contributed": holding.capital_contributed,
-            "capital_contributed_raw": holding.capital_contributed_raw,
+            "capital_contributed_raw": format_money(holding.capital_contributed),
             "capital_distributed": holding.capital_distributed,
-            "capital_distributed_raw": holding.capital_distributed_raw,
+            "capital_distributed_raw": format_money(holding.capital_distributed),
             "market_value": holding.market_value,
-            "market_value_raw": holding.market_value_raw,
+            "market_value_raw": format_money(holding.market_value),
             "inception_irr": holding.inception_irr,
             "lp_id": holding.lp_id,
             "lp_name": holding.lp_name,
@@ -1456,15 +1463,13 @@ async def list_portfolio_companies(
         companies = query.all()
 
         page = (offset // limit) + 1 if limit > 0 else 1
-        total_pages = (total + limit - 1) // limit if limit > 0 else 1
 
-        return PortfolioCompanyListResponse(
-            companies=[PortfolioCompanyResponse.model_validate(c) for c in companies],
+        return orjson_response(PORTFOLIO_COMPANY_LIST_RESPONSE_ADAPTER, PortfolioCompanyListResponse(
+            companies=[orm_to_response(PortfolioCompanyResponse, row) for row in companies],
             total=total,
             page=page,
-            page_size=limit,
-            total_pages=total_pages
-        )
+            page_size=limit
+        ))
 
     except Exception as e:
         logger.error(f"Failed to list portfolio companies: {e}")
@@ -1520,15 +1525,13 @@ async def get_fund_portfolio(
         companies = query.limit(limit).offset(offset).all()
 
         page = (offset // limit) + 1 if limit > 0 else 1
-        total_pages = (total + limit - 1) // limit if limit > 0 else 1
 
-        return PortfolioCompanyListResponse(
-            companies=[PortfolioCompanyResponse.model_validate(c) for c in companies],
+        return orjson_response(PORTFOLIO_COMPANY_LIST_RESPONSE_ADAPTER, PortfolioCompanyListResponse(
+            companies=[orm_to_response(PortfolioCompanyResponse, row) for row in companies],
             total=total,
             page=page,
-            page_size=limit,
-            total_pages=total_pages
-        )
+            page_size=limit
+        ))
 
     except HTTPException:
         raise
@@ -1549,7 +1552,7 @@ async def get_portfolio_company(
         if not company:
             raise HTTPException(status_code=404, detail="Portfolio company not found")
 
-        return PortfolioCompanyResponse.model_validate(company)
+        return orm_to_response(PortfolioCompanyResponse, company)
 
     except HTTPException:
         raise
@@ -1570,11 +1573,10 @@ async def create_portfolio_company(
         if not fund:
             raise HTTPException(status_code=404, detail="Fund not found")
 
-        company_id = str(uuid4())
+        company_id = uuid4().hex
         new_company = PortfolioCompany(
             id=company_id,
-            fund_name=company.fund_name or fund.name,
-            **company.model_dump(exclude={'fund_name'})
+            **company.model_dump()
         )
 
         db.add(new_company)
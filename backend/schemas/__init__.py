@@ -6,7 +6,7 @@ from .fund import (
     FundUpdate,
     FundResponse,
     FundListResponse,
-    FundSearchFilters,
+    FUND_LIST_RESPONSE_ADAPTER,
 )
 from .lp import (
     LPBase,
@@ -14,7 +14,7 @@ from .lp import (
     LPUpdate,
     LPResponse,
     LPListResponse,
-    LPSearchFilters,
+    LP_LIST_RESPONSE_ADAPTER,
     LPTypesResponse,
     LPStatistics,
     LPFundCommitmentBase,
@@ -29,13 +29,13 @@ __all__ = [
     "FundUpdate",
     "FundResponse",
     "FundListResponse",
-    "FundSearchFilters",
+    "FUND_LIST_RESPONSE_ADAPTER",
     "LPBase",
     "LPCreate",
     "LPUpdate",
     "LPResponse",
     "LPListResponse",
-    "LPSearchFilters",
+    "LP_LIST_RESPONSE_ADAPTER",
     "LPTypesResponse",
     "LPStatistics",
     "LPFundCommitmentBase",
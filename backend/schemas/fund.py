@@ -2,25 +2,36 @@
 Pydantic schemas for Fund API endpoints
 """
 
-from pydantic import BaseModel, Field
-from typing import Optional, List
+from __future__ import annotations
+
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, computed_field
+from typing import Annotated, List
+from dataclasses import dataclass
 from datetime import datetime
 
+from utils.money import format_money
+
+from .utils import partial_model
+
 
 class FundBase(BaseModel):
     """Base fund schema with common fields"""
     name: str = Field(..., description="Fund name")
-    description: Optional[str] = Field(None, description="Fund description")
+    description: str | None = Field(None, description="Fund description")
 
     # Fund details
-    founded_year: Optional[int] = Field(None, description="Year the fund was founded")
-    aum_raw: Optional[str] = Field(None, description="AUM as display string (e.g., '$500M')")
-    aum: Optional[float] = Field(None, description="AUM as float (e.g., 500000000.0)")
-    strategy: Optional[str] = Field(None, description="Investment strategy (e.g., 'Growth Equity', 'Venture Capital')")
+    founded_year: int | None = Field(None, description="Year the fund was founded")
+    aum: float | None = Field(None, description="AUM as float (e.g., 500000000.0)")
+    strategy: str | None = Field(None, description="Investment strategy (e.g., 'Growth Equity', 'Venture Capital')")
 
     # Contact & location
-    website: Optional[str] = Field(None, description="Fund website URL")
-    headquarters: Optional[str] = Field(None, description="Fund headquarters location")
+    website: str | None = Field(None, description="Fund website URL")
+    headquarters: str | None = Field(None, description="Fund headquarters location")
+
+    @computed_field(description="AUM as display string (e.g., '$500M')")
+    @property
+    def aum_raw(self) -> str | None:
+        return format_money(self.aum)
 
 
 class FundCreate(FundBase):
@@ -28,16 +39,7 @@ class FundCreate(FundBase):
     pass
 
 
-class FundUpdate(BaseModel):
-    """Schema for updating a fund (all fields optional)"""
-    name: Optional[str] = None
-    description: Optional[str] = None
-    founded_year: Optional[int] = None
-    aum_raw: Optional[str] = None
-    aum: Optional[float] = None
-    strategy: Optional[str] = None
-    website: Optional[str] = None
-    headquarters: Optional[str] = None
+FundUpdate = partial_model(FundBase, "FundUpdate", "Schema for updating a fund (all fields optional)")
 
 
 class FundResponse(FundBase):
@@ -46,36 +48,25 @@ class FundResponse(FundBase):
     created_at: datetime = Field(..., description="Creation timestamp")
     updated_at: datetime = Field(..., description="Last update timestamp")
 
-    class Config:
-        from_attributes = True  # Enable ORM mode for SQLAlchemy models
+    model_config = ConfigDict(from_attributes=True, defer_build=True, frozen=True)  # Enable ORM mode; build core schema lazily; read-only once built
 
 
-class FundListResponse(BaseModel):
+@dataclass(slots=True)
+class FundListResponse:
     """Schema for paginated list of funds"""
-    funds: List[FundResponse] = Field(..., description="List of funds")
-    total: int = Field(..., description="Total number of funds matching query")
-    page: int = Field(..., description="Current page number (1-indexed)")
-    page_size: int = Field(..., description="Number of items per page")
-    total_pages: int = Field(..., description="Total number of pages")
-
-    class Config:
-        from_attributes = True
-
-
-class FundSearchFilters(BaseModel):
-    """Schema for fund search and filter parameters"""
-    search: Optional[str] = Field(None, description="Search query for fund name")
-    strategy: Optional[str] = Field(None, description="Filter by investment strategy")
-    min_aum: Optional[float] = Field(None, description="Minimum AUM filter")
-    max_aum: Optional[float] = Field(None, description="Maximum AUM filter")
-    min_founded_year: Optional[int] = Field(None, description="Minimum founding year")
-    max_founded_year: Optional[int] = Field(None, description="Maximum founding year")
-    headquarters: Optional[str] = Field(None, description="Filter by headquarters location")
-
-    # Pagination
-    page: int = Field(1, ge=1, description="Page number (1-indexed)")
-    page_size: int = Field(20, ge=1, le=100, description="Items per page (max 100)")
-
-    # Sorting
-    sort_by: Optional[str] = Field("name", description="Field to sort by")
-    sort_order: Optional[str] = Field("asc", description="Sort order: 'asc' or 'desc'")
+    __pydantic_config__ = ConfigDict(defer_build=True)
+
+    funds: Annotated[List[FundResponse], Field(description="List of funds")]
+    total: Annotated[int, Field(description="Total number of funds matching query")]
+    page: Annotated[int, Field(description="Current page number (1-indexed)")]
+    page_size: Annotated[int, Field(description="Number of items per page")]
+
+    @computed_field(description="Total number of pages")
+    @property
+    def total_pages(self) -> int:
+        return -(-self.total // self.page_size) if self.page_size else 1
+
+
+# Serializes a whole page (nested models, computed fields) for orjson rendering
+FUND_LIST_RESPONSE_ADAPTER = TypeAdapter(FundListResponse)
+
@@ -2,58 +2,58 @@
 Pydantic schemas for LP (Limited Partner) API endpoints
 """
 
-from pydantic import BaseModel, Field
-from typing import Optional, List
+from __future__ import annotations
+
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, computed_field
+from typing import Annotated, Literal, List
+from dataclasses import dataclass
 from datetime import datetime
 
+from utils.money import format_money
+
+from .utils import partial_model
+
+RelationshipStatus = Literal["Active", "Prospective", "Inactive", "Former"]
+LPTier = Literal["Tier 1", "Tier 2", "Tier 3"]
+
 
 class LPBase(BaseModel):
     """Base LP schema with common fields"""
     name: str = Field(..., description="LP name")
 
     # Organization details
-    type: Optional[str] = Field(None, description="LP type (Individual, Family Office, Institution, Corporate, Foundation, Government, Other)")
-    description: Optional[str] = Field(None, description="LP description")
-    website: Optional[str] = Field(None, description="LP website URL")
+    type: str | None = Field(None, description="LP type (Individual, Family Office, Institution, Corporate, Foundation, Government, Other)")
+    description: str | None = Field(None, description="LP description")
+    website: str | None = Field(None, description="LP website URL")
 
     # Contact information
-    primary_contact_name: Optional[str] = Field(None, description="Primary contact person name")
-    primary_contact_email: Optional[str] = Field(None, description="Primary contact email")
-    primary_contact_phone: Optional[str] = Field(None, description="Primary contact phone")
-    location: Optional[str] = Field(None, description="LP location (City, Country)")
+    primary_contact_name: str | None = Field(None, description="Primary contact person name")
+    primary_contact_email: str | None = Field(None, description="Primary contact email")
+    primary_contact_phone: str | None = Field(None, description="Primary contact phone")
+    location: str | None = Field(None, description="LP location (City, Country)")
 
     # Investment details
-    total_committed_capital_raw: Optional[str] = Field(None, description="Total committed capital as display string (e.g., '$50M')")
-    total_committed_capital: Optional[float] = Field(None, description="Total committed capital as float (e.g., 50000000.0)")
-    investment_focus: Optional[str] = Field(None, description="Investment focus areas (e.g., 'Technology, Healthcare')")
-    first_investment_year: Optional[int] = Field(None, description="Year of first investment")
+    total_committed_capital: float | None = Field(None, description="Total committed capital as float (e.g., 50000000.0)")
+    investment_focus: str | None = Field(None, description="Investment focus areas (e.g., 'Technology, Healthcare')")
+    first_investment_year: int | None = Field(None, description="Year of first investment")
 
     # Relationship tracking
-    relationship_status: Optional[str] = Field(None, description="Relationship status (Active, Prospective, Inactive, Former)")
-    tier: Optional[str] = Field(None, description="Investment tier (Tier 1, Tier 2, Tier 3)")
+    relationship_status: str | None = Field(None, description="Relationship status (Active, Prospective, Inactive, Former)")
+    tier: str | None = Field(None, description="Investment tier (Tier 1, Tier 2, Tier 3)")
+
+    @computed_field(description="Total committed capital as display string (e.g., '$50M')")
+    @property
+    def total_committed_capital_raw(self) -> str | None:
+        return format_money(self.total_committed_capital)
 
 
 class LPCreate(LPBase):
-    """Schema for creating a new LP"""
-    pass
+    """Schema for creating a new LP (relationship status and tier restricted to the known values)"""
+    relationship_status: RelationshipStatus | None = Field(None, description="Relationship status (Active, Prospective, Inactive, Former)")
+    tier: LPTier | None = Field(None, description="Investment tier (Tier 1, Tier 2, Tier 3)")
 
 
-class LPUpdate(BaseModel):
-    """Schema for updating an LP (all fields optional)"""
-    name: Optional[str] = None
-    type: Optional[str] = None
-    description: Optional[str] = None
-    website: Optional[str] = None
-    primary_contact_name: Optional[str] = None
-    primary_contact_email: Optional[str] = None
-    primary_contact_phone: Optional[str] = None
-    location: Optional[str] = None
-    total_committed_capital_raw: Optional[str] = None
-    total_committed_capital: Optional[float] = None
-    investment_focus: Optional[str] = None
-    first_investment_year: Optional[int] = None
-    relationship_status: Optional[str] = None
-    tier: Optional[str] = None
+LPUpdate = partial_model(LPCreate, "LPUpdate", "Schema for updating an LP (all fields optional)")
 
 
 class LPResponse(LPBase):
@@ -62,53 +62,47 @@ class LPResponse(LPBase):
     created_at: datetime = Field(..., description="Creation timestamp")
     updated_at: datetime = Field(..., description="Last update timestamp")
 
-    class Config:
-        from_attributes = True  # Enable ORM mode for SQLAlchemy models
+    model_config = ConfigDict(from_attributes=True, defer_build=True, frozen=True)  # Enable ORM mode; build core schema lazily; read-only once built
 
 
-class LPListResponse(BaseModel):
+@dataclass(slots=True)
+class LPListResponse:
     """Schema for paginated list of LPs"""
-    lps: List[LPResponse] = Field(..., description="List of LPs")
-    total: int = Field(..., description="Total number of LPs matching query")
-    page: int = Field(..., description="Current page number (1-indexed)")
-    page_size: int = Field(..., description="Number of items per page")
-    total_pages: int = Field(..., description="Total number of pages")
-
-    class Config:
-        from_attributes = True
+    __pydantic_config__ = ConfigDict(defer_build=True)
 
+    lps: Annotated[List[LPResponse], Field(description="List of LPs")]
+    total: Annotated[int, Field(description="Total number of LPs matching query")]
+    page: Annotated[int, Field(description="Current page number (1-indexed)")]
+    page_size: Annotated[int, Field(description="Number of items per page")]
 
-class LPSearchFilters(BaseModel):
-    """Schema for LP search and filter parameters"""
-    search: Optional[str] = Field(None, description="Search query for LP name")
-    type: Optional[str] = Field(None, description="Filter by LP type")
-    location: Optional[str] = Field(None, description="Filter by location")
-    relationship_status: Optional[str] = Field(None, description="Filter by relationship status")
-    tier: Optional[str] = Field(None, description="Filter by tier")
-    min_commitment: Optional[float] = Field(None, description="Minimum commitment filter")
-    max_commitment: Optional[float] = Field(None, description="Maximum commitment filter")
-    min_investment_year: Optional[int] = Field(None, description="Minimum first investment year")
-    max_investment_year: Optional[int] = Field(None, description="Maximum first investment year")
+    @computed_field(description="Total number of pages")
+    @property
+    def total_pages(self) -> int:
+        return -(-self.total // self.page_size) if self.page_size else 1
 
-    # Pagination
-    page: int = Field(1, ge=1, description="Page number (1-indexed)")
-    page_size: int = Field(20, ge=1, le=100, description="Items per page (max 100)")
 
-    # Sorting
-    sort_by: Optional[str] = Field("name", description="Field to sort by (name, total_committed_capital, first_investment_year, created_at)")
-    sort_order: Optional[str] = Field("asc", description="Sort order: 'asc' or 'desc'")
+# Serializes a whole page (nested models, computed fields) for orjson rendering
+LP_LIST_RESPONSE_ADAPTER = TypeAdapter(LPListResponse)
 
 
 class LPFundCommitmentBase(BaseModel):
     """Base LP-Fund commitment schema"""
     lp_id: str = Field(..., description="LP ID")
     fund_id: str = Field(..., description="Fund ID")
-    commitment_amount_raw: Optional[str] = Field(None, description="Commitment amount as display string (e.g., '$10M')")
-    commitment_amount: Optional[float] = Field(None, description="Commitment amount as float (e.g., 10000000.0)")
-    commitment_date: Optional[datetime] = Field(None, description="Date of commitment")
-    capital_called_raw: Optional[str] = Field(None, description="Capital called as display string (e.g., '$7M')")
-    capital_called: Optional[float] = Field(None, description="Capital called as float (e.g., 7000000.0)")
-    notes: Optional[str] = Field(None, description="Additional notes")
+    commitment_amount: float | None = Field(None, description="Commitment amount as float (e.g., 10000000.0)")
+    commitment_date: datetime | None = Field(None, description="Date of commitment")
+    capital_called: float | None = Field(None, description="Capital called as float (e.g., 7000000.0)")
+    notes: str | None = Field(None, description="Additional notes")
+
+    @computed_field(description="Commitment amount as display string (e.g., '$10M')")
+    @property
+    def commitment_amount_raw(self) -> str | None:
+        return format_money(self.commitment_amount)
+
+    @computed_field(description="Capital called as display string (e.g., '$7M')")
+    @property
+    def capital_called_raw(self) -> str | None:
+        return format_money(self.capital_called)
 
 
 class LPFundCommitmentCreate(LPFundCommitmentBase):
@@ -116,14 +110,12 @@ class LPFundCommitmentCreate(LPFundCommitmentBase):
     pass
 
 
-class LPFundCommitmentUpdate(BaseModel):
-    """Schema for updating an LP-Fund commitment (all fields optional)"""
-    commitment_amount_raw: Optional[str] = None
-    commitment_amount: Optional[float] = None
-    commitment_date: Optional[datetime] = None
-    capital_called_raw: Optional[str] = None
-    capital_called: Optional[float] = None
-    notes: Optional[str] = None
+LPFundCommitmentUpdate = partial_model(
+    LPFundCommitmentBase,
+    "LPFundCommitmentUpdate",
+    "Schema for updating an LP-Fund commitment (all fields optional)",
+    exclude=("lp_id", "fund_id"),
+)
 
 
 class LPFundCommitmentResponse(LPFundCommitmentBase):
@@ -132,8 +124,7 @@ class LPFundCommitmentResponse(LPFundCommitmentBase):
     created_at: datetime = Field(..., description="Creation timestamp")
     updated_at: datetime = Field(..., description="Last update timestamp")
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, defer_build=True, frozen=True)
 
 
 class LPTypesResponse(BaseModel):
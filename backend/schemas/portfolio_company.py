@@ -2,63 +2,79 @@
 Pydantic schemas for Portfolio Company API
 """
 
-from pydantic import BaseModel, Field
-from typing import Optional, List
+from __future__ import annotations
+
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, computed_field
+from typing import Literal, List
+from dataclasses import dataclass
 from datetime import datetime
 
+from utils.money import format_money
+
+from .utils import partial_model
+
+PortfolioCompanyStatus = Literal["Active", "Exited", "IPO"]
+
 
 class PortfolioCompanyBase(BaseModel):
     """Base schema for portfolio company data"""
     name: str = Field(..., description="Company name")
-    sector: Optional[str] = Field(None, description="Industry sector")
-    stage: Optional[str] = Field(None, description="Investment stage (Series A, Series B, Growth, etc.)")
-    location: Optional[str] = Field(None, description="Company headquarters location")
-    description: Optional[str] = Field(None, description="Company description")
-    website: Optional[str] = Field(None, description="Company website URL")
-    logo_url: Optional[str] = Field(None, description="Company logo URL")
-    investment_date: Optional[datetime] = Field(None, description="Date of investment")
-    valuation_raw: Optional[str] = Field(None, description="Valuation as string (e.g., '$2.5B')")
-    valuation: Optional[float] = Field(None, description="Valuation as numeric value")
-    status: Optional[str] = Field("Active", description="Investment status: Active, Exited, IPO")
+    sector: str | None = Field(None, description="Industry sector")
+    stage: str | None = Field(None, description="Investment stage (Series A, Series B, Growth, etc.)")
+    location: str | None = Field(None, description="Company headquarters location")
+    description: str | None = Field(None, description="Company description")
+    website: str | None = Field(None, description="Company website URL")
+    logo_url: str | None = Field(None, description="Company logo URL")
+    investment_date: datetime | None = Field(None, description="Date of investment")
+    valuation: float | None = Field(None, description="Valuation as numeric value")
+    status: str | None = Field("Active", description="Investment status: Active, Exited, IPO")
+
+    @computed_field(description="Valuation as string (e.g., '$2.5B')")
+    @property
+    def valuation_raw(self) -> str | None:
+        return format_money(self.valuation)
 
 
 class PortfolioCompanyCreate(PortfolioCompanyBase):
-    """Schema for creating a portfolio company"""
+    """Schema for creating a portfolio company (status restricted to the known values)"""
     fund_id: str = Field(..., description="Fund ID that made the investment")
-    fund_name: Optional[str] = Field(None, description="Fund name (denormalized)")
+    status: PortfolioCompanyStatus | None = Field("Active", description="Investment status: Active, Exited, IPO")
 
 
-class PortfolioCompanyUpdate(BaseModel):
-    """Schema for updating a portfolio company"""
-    name: Optional[str] = None
-    sector: Optional[str] = None
-    stage: Optional[str] = None
-    location: Optional[str] = None
-    description: Optional[str] = None
-    website: Optional[str] = None
-    logo_url: Optional[str] = None
-    investment_date: Optional[datetime] = None
-    valuation_raw: Optional[str] = None
-    valuation: Optional[float] = None
-    status: Optional[str] = None
+PortfolioCompanyUpdate = partial_model(
+    PortfolioCompanyCreate,
+    "PortfolioCompanyUpdate",
+    "Schema for updating a portfolio company",
+    exclude=("fund_id",)
+)
 
 
 class PortfolioCompanyResponse(PortfolioCompanyBase):
     """Schema for portfolio company response"""
     id: str
     fund_id: str
-    fund_name: Optional[str]
+    fund_name: str | None
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, defer_build=True, frozen=True)
 
 
-class PortfolioCompanyListResponse(BaseModel):
+@dataclass(slots=True)
+class PortfolioCompanyListResponse:
     """Schema for paginated portfolio company list response"""
+    __pydantic_config__ = ConfigDict(defer_build=True)
+
     companies: List[PortfolioCompanyResponse]
     total: int
     page: int = 1
     page_size: int = 50
-    total_pages: int = 1
+
+    @computed_field(description="Total number of pages")
+    @property
+    def total_pages(self) -> int:
+        return -(-self.total // self.page_size) if self.page_size else 1
+
+
+# Serializes a whole page (nested models, computed fields) for orjson rendering
+PORTFOLIO_COMPANY_LIST_RESPONSE_ADAPTER = TypeAdapter(PortfolioCompanyListResponse)
@@ -0,0 +1,42 @@
+"""
+Shared helpers and field types for the API schemas
+"""
+
+from typing import Iterable, Optional, Type
+
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, Field, TypeAdapter, create_model
+
+
+def partial_model(
+    base: Type[BaseModel],
+    name: str,
+    doc: str,
+    exclude: Iterable[str] = ()
+) -> Type[BaseModel]:
+    """
+    Build an update schema from ``base`` with every field optional.
+
+    Field names, types and descriptions come from ``base`` so they only have
+    to be declared once; each field defaults to None so that
+    ``model_dump(exclude_unset=True)`` yields just the fields the client sent.
+    Fields listed in ``exclude`` are left out of the derived model.
+    """
+    excluded = set(exclude)
+    fields = {
+        field_name: (Optional[field.annotation], Field(None, description=field.description))
+        for field_name, field in base.model_fields.items()
+        if field_name not in excluded
+    }
+    return create_model(name, __doc__=doc, __module__=base.__module__, **fields)
+
+
+def orjson_response(adapter: TypeAdapter, payload) -> ORJSONResponse:
+    """
+    Render a list response straight to JSON with orjson.
+
+    The payload is dumped once through its cached TypeAdapter (which applies
+    computed fields and custom serializers) and handed to ORJSONResponse,
+    skipping FastAPI's response_model re-validation and jsonable_encoder.
+    """
+    return ORJSONResponse(adapter.dump_python(payload))
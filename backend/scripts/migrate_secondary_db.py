@@ -0,0 +1,37 @@
+"""
+Apply the app's schema additions to the secondary funds database.
+
+The secondary funds SQLite file is built outside the app. Run this once
+after each new build of that file (not from the API process) to create the
+indexes declared on the secondary funds models and the FTS5 trigram tables
+(with their sync triggers) behind the name searches.
+"""
+
+import sys
+import os
+import logging
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from secondary_funds.database import DB_PATH, ensure_indexes
+
+
+def migrate_secondary_database(rebuild_search: bool = False):
+    """Create the missing secondary funds indexes and search tables."""
+    print(f"Migrating secondary funds database at {DB_PATH}...")
+    ensure_indexes(rebuild_search=rebuild_search)
+    print("Secondary funds database migrated.")
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Apply app indexes and search tables to the secondary funds database")
+    parser.add_argument("--rebuild-search", action="store_true",
+                        help="Re-index the trigram search tables from their source columns")
+
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    migrate_secondary_database(rebuild_search=args.rebuild_search)
@@ -1,4 +1,5 @@
 """Secondary Funds Database module - LP/GP/Fund data from Preqin."""
+from .database import load_search_tables as load_secondary_search_tables
 from .routes import router as secondary_funds_router
 
-__all__ = ["secondary_funds_router"]
+__all__ = ["secondary_funds_router", "load_secondary_search_tables"]
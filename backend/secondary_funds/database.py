@@ -1,8 +1,11 @@
 """Database connection for secondary funds SQLite database."""
+import logging
 import os
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, exc, text
 from sqlalchemy.orm import sessionmaker, declarative_base
 
+logger = logging.getLogger(__name__)
+
 # Path to the secondary funds database
 DB_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), "data", "secondary_funds.db")
 DATABASE_URL = f"sqlite:///{DB_PATH}"
@@ -11,16 +14,36 @@ DATABASE_URL = f"sqlite:///{DB_PATH}"
 engine = create_engine(
     DATABASE_URL,
     connect_args={"check_same_thread": False},
-    echo=False
+    echo=False,
+    # Room for every filter/sort/pagination combination of the list routes in
+    # the compiled-SQL cache (default 500), so they are not recompiled
+    query_cache_size=1200,
+    # Sync routes run on FastAPI's 40-thread pool; leave headroom above that
+    # so concurrent requests never wait on a pooled connection
+    pool_size=20,
+    max_overflow=40,
 )
 
-# Session factory
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# Session factory; the routes only read, so there is nothing to flush and
+# no reason to expire loaded objects when a session commits
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=engine)
 
 # Base class for models
 Base = declarative_base()
 
 
+# FTS5 trigram indexes backing the substring name searches (ilike '%x%'),
+# which a btree index cannot serve: index table -> (content table, column)
+TRIGRAM_SEARCH_TABLES = {
+    "fund_name_trgm": ("fund", "fund_name"),
+    "gp_name_trgm": ("gp", "institution_name"),
+    "lp_name_trgm": ("lp", "institution_name"),
+}
+
+# Trigram index tables present in the database file (filled at startup by load_search_tables)
+available_search_tables: set = set()
+
+
 def get_secondary_db():
     """Dependency for getting secondary funds database session."""
     db = SessionLocal()
@@ -28,3 +51,89 @@ def get_secondary_db():
         yield db
     finally:
         db.close()
+
+
+def ensure_indexes(rebuild_search: bool = False):
+    """
+    Create model-declared indexes that are missing from the existing database file.
+
+    The secondary funds database is built outside the app, so indexes added
+    to the models (and the trigram search tables) are applied by this one-off
+    step, run from scripts/migrate_secondary_db.py after each new build of
+    the file; existing indexes are left as they are. Failures (a read-only or
+    locked file, a schema missing an indexed column) are logged and skipped.
+    """
+    if not os.path.exists(DB_PATH):
+        logger.warning(f"Secondary funds database not found at {DB_PATH}; nothing to migrate")
+        return
+    from . import models  # register the tables on Base.metadata
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            try:
+                index.create(bind=engine, checkfirst=True)
+            except exc.SQLAlchemyError as e:
+                logger.warning(f"Could not create secondary index {index.name}: {e}")
+    ensure_trigram_search_tables(rebuild=rebuild_search)
+
+
+def ensure_trigram_search_tables(rebuild: bool = False):
+    """
+    Create the FTS5 trigram tables in TRIGRAM_SEARCH_TABLES and their sync triggers.
+
+    Each is an external-content table over its source column, so it only
+    stores the index. AFTER INSERT/DELETE/UPDATE triggers on the source
+    table keep it current; note that once they exist, anything writing those
+    tables needs an SQLite build with the FTS5 trigram tokenizer. A table is
+    filled when it is first created, and only re-indexed again on request.
+    SQLite builds without the tokenizer (before 3.34) are logged and skipped,
+    leaving name search on plain scans.
+    """
+    for name, (content, column) in TRIGRAM_SEARCH_TABLES.items():
+        try:
+            with engine.begin() as conn:
+                created = not conn.execute(
+                    text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name"),
+                    {"name": name}
+                ).first()
+                conn.execute(text(
+                    f"CREATE VIRTUAL TABLE IF NOT EXISTS {name} USING fts5("
+                    f"{column}, content='{content}', content_rowid='id', tokenize='trigram')"
+                ))
+                conn.execute(text(
+                    f"CREATE TRIGGER IF NOT EXISTS {name}_ai AFTER INSERT ON {content} BEGIN "
+                    f"INSERT INTO {name}(rowid, {column}) VALUES (new.id, new.{column}); END"
+                ))
+                conn.execute(text(
+                    f"CREATE TRIGGER IF NOT EXISTS {name}_ad AFTER DELETE ON {content} BEGIN "
+                    f"INSERT INTO {name}({name}, rowid, {column}) VALUES ('delete', old.id, old.{column}); END"
+                ))
+                conn.execute(text(
+                    f"CREATE TRIGGER IF NOT EXISTS {name}_au AFTER UPDATE ON {content} BEGIN "
+                    f"INSERT INTO {name}({name}, rowid, {column}) VALUES ('delete', old.id, old.{column}); "
+                    f"INSERT INTO {name}(rowid, {column}) VALUES (new.id, new.{column}); END"
+                ))
+                if created or rebuild:
+                    conn.execute(text(f"INSERT INTO {name}({name}) VALUES ('rebuild')"))
+        except exc.SQLAlchemyError as e:
+            logger.warning(f"Could not set up trigram search table {name}: {e}")
+
+
+def load_search_tables():
+    """
+    Record which trigram search tables exist, so name searches can use them.
+
+    Only reads sqlite_master; the tables are created by the migration step.
+    Any failure leaves name search on plain ilike scans.
+    """
+    available_search_tables.clear()
+    if not os.path.exists(DB_PATH):
+        return
+    try:
+        with engine.connect() as conn:
+            existing = conn.execute(
+                text("SELECT name FROM sqlite_master WHERE type = 'table'")
+            ).scalars().all()
+    except exc.SQLAlchemyError as e:
+        logger.warning(f"Could not inspect the secondary funds database: {e}")
+        return
+    available_search_tables.update(name for name in TRIGRAM_SEARCH_TABLES if name in existing)
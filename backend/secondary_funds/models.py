@@ -1,7 +1,6 @@
 """SQLAlchemy models for secondary funds database."""
-from datetime import datetime
-from sqlalchemy import Column, Integer, String, Numeric, DateTime, Date, ForeignKey, Text
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, Integer, String, Numeric, DateTime, Date, ForeignKey, Text, Index, func, select
+from sqlalchemy.orm import column_property, relationship
 from .database import Base
 
 
@@ -50,16 +49,22 @@ class SecondaryGP(Base):
     city = Column(String(100), nullable=True)
     country = Column(String(100), nullable=True)
     institution_type_id = Column(Integer, ForeignKey("institution_type.id"), nullable=True)
-    aum_usd = Column(Numeric(18, 2), nullable=True)
+    aum_usd = Column(Numeric(18, 2, asdecimal=False), nullable=True)
     aum_raw = Column(String(50), nullable=True)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime, server_default=func.now(), nullable=False)
+    updated_at = Column(DateTime, server_default=func.now(), nullable=False)
 
     # Relationships
     institution_type = relationship("InstitutionType", lazy="joined")
     funds = relationship("SecondaryFund", back_populates="gp", lazy="dynamic")
 
 
+# (sort column, id) indexes backing keyset pagination of the GP list
+Index('idx_gp_institution_name_id', SecondaryGP.institution_name, SecondaryGP.id)
+Index('idx_gp_aum_usd_id', SecondaryGP.aum_usd, SecondaryGP.id)
+Index('idx_gp_country_id', SecondaryGP.country, SecondaryGP.id)
+
+
 class SecondaryLP(Base):
     """Limited Partner - institutional investors in secondary funds."""
     __tablename__ = "lp"
@@ -69,15 +74,21 @@ class SecondaryLP(Base):
     city = Column(String(100), nullable=True)
     country = Column(String(100), nullable=True)
     institution_type_id = Column(Integer, ForeignKey("institution_type.id"), nullable=True)
-    aum_usd = Column(Numeric(18, 2), nullable=True)
+    aum_usd = Column(Numeric(18, 2, asdecimal=False), nullable=True)
     aum_raw = Column(String(50), nullable=True)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime, server_default=func.now(), nullable=False)
+    updated_at = Column(DateTime, server_default=func.now(), nullable=False)
 
     # Relationships
     institution_type = relationship("InstitutionType", lazy="joined")
 
 
+# (sort column, id) indexes backing keyset pagination of the LP list
+Index('idx_lp_institution_name_id', SecondaryLP.institution_name, SecondaryLP.id)
+Index('idx_lp_aum_usd_id', SecondaryLP.aum_usd, SecondaryLP.id)
+Index('idx_lp_country_id', SecondaryLP.country, SecondaryLP.id)
+
+
 class SecondaryFund(Base):
     """Secondary fund model."""
     __tablename__ = "fund"
@@ -92,30 +103,54 @@ class SecondaryFund(Base):
     fund_close_year = Column(Integer, nullable=True)
     launch_year = Column(Integer, nullable=True)
 
-    # Size fields (normalized to USD millions)
-    fund_size_usd = Column(Numeric(18, 2), nullable=True)
+    # Size fields (normalized to USD millions); Numeric columns are read back as plain
+    # numbers, not Decimal (on SQLite integer-valued cells come back as int)
+    fund_size_usd = Column(Numeric(18, 2, asdecimal=False), nullable=True)
     fund_size_raw = Column(String(50), nullable=True)
-    target_size_usd = Column(Numeric(18, 2), nullable=True)
+    target_size_usd = Column(Numeric(18, 2, asdecimal=False), nullable=True)
     target_size_raw = Column(String(50), nullable=True)
 
     # Performance metrics
-    dpi = Column(Numeric(6, 3), nullable=True)
-    tvpi = Column(Numeric(6, 3), nullable=True)
-    irr = Column(Numeric(6, 2), nullable=True)
+    dpi = Column(Numeric(6, 3, asdecimal=False), nullable=True)
+    tvpi = Column(Numeric(6, 3, asdecimal=False), nullable=True)
+    irr = Column(Numeric(6, 2, asdecimal=False), nullable=True)
 
     # Data provenance
     data_source = Column(Text, nullable=True)
     last_reporting_date = Column(Date, nullable=True)
     source_file = Column(String(255), nullable=True)
 
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime, server_default=func.now(), nullable=False)
+    updated_at = Column(DateTime, server_default=func.now(), nullable=False)
 
     # Relationships
     gp = relationship("SecondaryGP", back_populates="funds", lazy="joined")
     status = relationship("FundStatus", lazy="joined")
-    strategies = relationship("FundStrategy", back_populates="fund", lazy="joined")
-    sectors = relationship("FundSector", back_populates="fund", lazy="joined")
+    strategies = relationship("FundStrategy", back_populates="fund", lazy="selectin")
+    sectors = relationship("FundSector", back_populates="fund", lazy="selectin")
+
+
+# Foreign-key indexes for the GP and status joins/filters on funds
+Index('idx_secondary_fund_gp', SecondaryFund.gp_id)
+Index('idx_secondary_fund_status', SecondaryFund.status_id)
+
+# Number of funds per GP as a correlated count over idx_secondary_fund_gp;
+# deferred, so only queries that undefer() it pay for the subquery
+SecondaryGP.fund_count = column_property(
+    select(func.count())
+    .where(SecondaryFund.gp_id == SecondaryGP.id)
+    .correlate_except(SecondaryFund)
+    .scalar_subquery(),
+    deferred=True
+)
+
+# (sort column, id) indexes backing keyset pagination of the fund list
+Index('idx_secondary_fund_fund_name_id', SecondaryFund.fund_name, SecondaryFund.id)
+Index('idx_secondary_fund_vintage_year_id', SecondaryFund.vintage_year, SecondaryFund.id)
+Index('idx_secondary_fund_fund_size_usd_id', SecondaryFund.fund_size_usd, SecondaryFund.id)
+Index('idx_secondary_fund_irr_id', SecondaryFund.irr, SecondaryFund.id)
+Index('idx_secondary_fund_tvpi_id', SecondaryFund.tvpi, SecondaryFund.id)
+Index('idx_secondary_fund_dpi_id', SecondaryFund.dpi, SecondaryFund.id)
 
 
 class FundStrategy(Base):
@@ -130,6 +165,10 @@ class FundStrategy(Base):
     strategy = relationship("Strategy", lazy="joined")
 
 
+# Reverse of the (fund_id, strategy_id) primary key: funds for a given strategy
+Index('idx_fund_strategy_strategy_fund', FundStrategy.strategy_id, FundStrategy.fund_id)
+
+
 class FundSector(Base):
     """Many-to-many: Fund to Sector association."""
     __tablename__ = "fund_sector"
@@ -140,3 +179,7 @@ class FundSector(Base):
     # Relationships
     fund = relationship("SecondaryFund", back_populates="sectors")
     sector = relationship("Sector", lazy="joined")
+
+
+# Reverse of the (fund_id, sector_id) primary key: funds for a given sector
+Index('idx_fund_sector_sector_fund', FundSector.sector_id, FundSector.fund_id)
@@ -1,28 +1,247 @@
 """API routes for secondary funds database."""
+import base64
+import hashlib
+import json
 import os
+import threading
 import time
 from fastapi import APIRouter, Depends, Query, HTTPException
-from sqlalchemy.orm import Session
-from sqlalchemy import func, or_, text
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.orm import Session, joinedload, raiseload, selectinload, undefer
+from sqlalchemy import and_, column, func, literal, or_, select, table, text, union_all
 from typing import Optional, List
 
-from .database import get_secondary_db
+from schemas.utils import orjson_response
+
+from .database import SessionLocal, available_search_tables, get_secondary_db
 from .models import SecondaryFund, SecondaryGP, SecondaryLP, FundStrategy, FundSector, FundStatus, Strategy, Sector
 from .schemas import (
-    SecondaryFundResponse, SecondaryFundListResponse,
-    SecondaryGPResponse, SecondaryGPListResponse,
-    SecondaryLPResponse, SecondaryLPListResponse,
+    SecondaryFundResponse, SecondaryFundListResponse, SECONDARY_FUND_LIST_RESPONSE_ADAPTER,
+    SecondaryGPResponse, SecondaryGPListResponse, SECONDARY_GP_LIST_RESPONSE_ADAPTER,
+    SecondaryLPResponse, SecondaryLPListResponse, SECONDARY_LP_LIST_RESPONSE_ADAPTER,
     SecondaryStatsResponse, NLQRequest, NLQResponse,
     FundStatusEnum, StrategyEnum, SectorEnum
 )
 
 router = APIRouter(prefix="/api/secondary-funds", tags=["Secondary Funds"])
 
+# Sortable columns per list endpoint; each has a (column, id) index for keyset pagination
+FUND_SORT_COLUMNS = {
+    "fund_name": SecondaryFund.fund_name,
+    "vintage_year": SecondaryFund.vintage_year,
+    "fund_size_usd": SecondaryFund.fund_size_usd,
+    "irr": SecondaryFund.irr,
+    "tvpi": SecondaryFund.tvpi,
+    "dpi": SecondaryFund.dpi,
+}
+GP_SORT_COLUMNS = {
+    "institution_name": SecondaryGP.institution_name,
+    "aum_usd": SecondaryGP.aum_usd,
+    "country": SecondaryGP.country,
+}
+LP_SORT_COLUMNS = {
+    "institution_name": SecondaryLP.institution_name,
+    "aum_usd": SecondaryLP.aum_usd,
+    "country": SecondaryLP.country,
+}
+
+
+# Everything fund_to_response touches, loaded up front: joins for the scalar
+# relationships, one SELECT ... IN per collection (no row multiplication)
+FUND_LOADER_OPTIONS = (
+    joinedload(SecondaryFund.gp),
+    joinedload(SecondaryFund.status),
+    selectinload(SecondaryFund.strategies).joinedload(FundStrategy.strategy),
+    selectinload(SecondaryFund.sectors).joinedload(FundSector.sector),
+)
+
+# In development, make any other relationship access on listed funds raise
+# instead of silently lazy-loading one query per row
+if os.getenv("DEV_RAISELOAD", "false").lower() == "true":
+    FUND_LOADER_OPTIONS += (raiseload("*"),)
+
+# Fund list rows straight from Core: GP/status names come from outer joins,
+# strategy/sector codes from correlated group_concat subqueries so list
+# filters never narrow or multiply them
+FUND_LIST_FROM = (
+    SecondaryFund.__table__
+    .outerjoin(SecondaryGP.__table__, SecondaryFund.gp_id == SecondaryGP.id)
+    .outerjoin(FundStatus.__table__, SecondaryFund.status_id == FundStatus.id)
+)
+FUND_LIST_SELECT = select(
+    SecondaryFund.id,
+    SecondaryFund.fund_name,
+    SecondaryFund.gp_id,
+    SecondaryGP.institution_name.label("fund_manager_name"),
+    FundStatus.name.label("status"),
+    SecondaryFund.vintage_year,
+    SecondaryFund.fund_close_year,
+    SecondaryFund.launch_year,
+    SecondaryFund.fund_size_raw,
+    SecondaryFund.fund_size_usd,
+    SecondaryFund.target_size_raw,
+    SecondaryFund.target_size_usd,
+    SecondaryFund.dpi,
+    SecondaryFund.tvpi,
+    SecondaryFund.irr,
+    select(func.group_concat(Strategy.code))
+    .join_from(FundStrategy, Strategy)
+    .where(FundStrategy.fund_id == SecondaryFund.id)
+    .scalar_subquery()
+    .label("strategies"),
+    select(func.group_concat(Sector.code))
+    .join_from(FundSector, Sector)
+    .where(FundSector.fund_id == SecondaryFund.id)
+    .scalar_subquery()
+    .label("sectors"),
+    SecondaryFund.data_source,
+    SecondaryFund.last_reporting_date,
+    SecondaryFund.created_at,
+    SecondaryFund.updated_at,
+).select_from(FUND_LIST_FROM)
+
+
+def name_contains(model, name_column, search_table: str, search: str):
+    """
+    Case-insensitive substring match on a name column.
+
+    When the column's FTS5 trigram table exists the match runs against it
+    (SQLite serves LIKE '%x%' from the trigram index) and selects ids;
+    otherwise it falls back to a plain ilike scan.
+    """
+    pattern = f"%{search}%"
+    if search_table in available_search_tables:
+        search_index = table(search_table, column("rowid"), column(name_column.key))
+        return model.id.in_(
+            select(search_index.c.rowid).where(search_index.c[name_column.key].like(pattern))
+        )
+    return name_column.ilike(pattern)
+
+
+def encode_cursor(sort_by: str, sort_direction: str, value, row_id: int) -> str:
+    """Encode the sort key of the last row on a page as an opaque cursor."""
+    payload = {"by": sort_by, "dir": sort_direction, "v": value, "id": row_id}
+    return base64.urlsafe_b64encode(json.dumps(payload).encode()).decode()
+
+
+def decode_cursor(cursor: str, sort_by: str, sort_direction: str) -> tuple:
+    """Decode a cursor into (last value, last id); it must match the requested sort."""
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        value, row_id = payload["v"], int(payload["id"])
+    except (ValueError, KeyError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    # Sort keys are scalar column values; anything else would only fail as a bind parameter
+    if isinstance(value, bool) or not isinstance(value, (str, int, float, type(None))):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    if payload.get("by") != sort_by or payload.get("dir") != sort_direction:
+        raise HTTPException(status_code=400, detail="Cursor does not match sort_by/sort_direction")
+    return value, row_id
+
+
+def keyset_filter(sort_column, id_column, descending: bool, value, row_id: int):
+    """
+    Rows strictly after (value, row_id) in (sort_column, id) order.
+
+    NULL sort values are treated as the smallest (SQLite orders them first
+    ascending and last descending), so they are spelled out instead of using
+    a row-value comparison.
+    """
+    if descending:
+        if value is None:
+            return and_(sort_column.is_(None), id_column < row_id)
+        return or_(
+            sort_column < value,
+            and_(sort_column == value, id_column < row_id),
+            sort_column.is_(None),
+        )
+    if value is None:
+        return or_(and_(sort_column.is_(None), id_column > row_id), sort_column.isnot(None))
+    return or_(sort_column > value, and_(sort_column == value, id_column > row_id))
+
+
+def normalize_sort(sort_columns: dict, sort_by: str, sort_direction: str) -> tuple:
+    """Validate a requested sort against the endpoint's whitelist and return (sort_by, "asc"|"desc")."""
+    if sort_by not in sort_columns:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid sort_by '{sort_by}'; expected one of: {', '.join(sort_columns)}"
+        )
+    sort_direction = (sort_direction or "asc").lower()
+    if sort_direction not in ("asc", "desc"):
+        raise HTTPException(status_code=400, detail="Invalid sort_direction; expected 'asc' or 'desc'")
+    return sort_by, sort_direction
+
+
+def order_by_sort(query, model, sort_column, descending: bool):
+    """Order a list query by sort_column with id as the tie-breaker."""
+    if descending:
+        return query.order_by(sort_column.desc(), model.id.desc())
+    return query.order_by(sort_column.asc(), model.id.asc())
+
+
+def sorted_templates(query, model, sort_columns: dict) -> dict:
+    """Pre-build query ordered for every (sort_by, sort_direction) combination."""
+    return {
+        (sort_by, sort_direction): order_by_sort(query, model, sort_column, sort_direction == "desc")
+        for sort_by, sort_column in sort_columns.items()
+        for sort_direction in ("asc", "desc")
+    }
+
+
+# The fund list select, already ordered, for each sort; requests only add
+# their filters and the page slice
+FUND_LIST_TEMPLATES = sorted_templates(FUND_LIST_SELECT, SecondaryFund, FUND_SORT_COLUMNS)
+
+
+def paginate(query, model, sort_columns: dict, sort_by: str, sort_direction: str,
+             page: int, page_size: int, cursor: Optional[str], fetch=lambda query: query.all(),
+             ordered: bool = False) -> tuple:
+    """
+    Order and slice a list query, returning (rows, next_cursor).
+
+    With a cursor the page starts right after the cursor's row (an index
+    seek); without one the classic page/page_size offset is used. One extra
+    row is fetched to tell whether a next page exists. ``query`` may be an
+    ORM Query or a Core select, in which case ``fetch`` executes it; pass
+    ``ordered=True`` if it already comes from ``sorted_templates``.
+    """
+    sort_by, sort_direction = normalize_sort(sort_columns, sort_by, sort_direction)
+    sort_column = sort_columns[sort_by]
+    descending = sort_direction == "desc"
+
+    if not ordered:
+        query = order_by_sort(query, model, sort_column, descending)
+
+    if cursor:
+        value, row_id = decode_cursor(cursor, sort_by, sort_direction)
+        query = query.filter(keyset_filter(sort_column, model.id, descending, value, row_id))
+    else:
+        query = query.offset((page - 1) * page_size)
+
+    rows = fetch(query.limit(page_size + 1))
+    if len(rows) <= page_size:
+        return rows, None
+
+    rows = rows[:page_size]
+    last = rows[-1]
+    return rows, encode_cursor(sort_by, sort_direction, getattr(last, sort_column.key), last.id)
+
+
+# Numeric response fields; SQLite hands back integer-valued cells as int,
+# and model_construct does not coerce them to the declared float
+FUND_FLOAT_FIELDS = ("fund_size_usd", "target_size_usd", "dpi", "tvpi", "irr")
+
+
+def as_float(value):
+    """Coerce a numeric column value to float, keeping None."""
+    return float(value) if value is not None else None
+
 
 def fund_to_response(fund) -> dict:
-    """Convert Fund model to response dict."""
-    strategies = [fs.strategy.code for fs in fund.strategies] if fund.strategies else []
-    sectors = [fs.sector.code for fs in fund.sectors] if fund.sectors else []
+    """Convert Fund model to response dict (strategy and sector codes sorted)."""
+    strategies = sorted(fs.strategy.code for fs in fund.strategies) if fund.strategies else []
+    sectors = sorted(fs.sector.code for fs in fund.sectors) if fund.sectors else []
 
     return {
         "id": fund.id,
@@ -34,12 +253,12 @@ def fund_to_response(fund) -> dict:
         "fund_close_year": fund.fund_close_year,
         "launch_year": fund.launch_year,
         "fund_size_raw": fund.fund_size_raw,
-        "fund_size_usd": float(fund.fund_size_usd) if fund.fund_size_usd else None,
+        "fund_size_usd": as_float(fund.fund_size_usd),
         "target_size_raw": fund.target_size_raw,
-        "target_size_usd": float(fund.target_size_usd) if fund.target_size_usd else None,
-        "dpi": float(fund.dpi) if fund.dpi else None,
-        "tvpi": float(fund.tvpi) if fund.tvpi else None,
-        "irr": float(fund.irr) if fund.irr else None,
+        "target_size_usd": as_float(fund.target_size_usd),
+        "dpi": as_float(fund.dpi),
+        "tvpi": as_float(fund.tvpi),
+        "irr": as_float(fund.irr),
         "strategies": strategies,
         "sectors": sectors,
         "data_source": fund.data_source,
@@ -49,6 +268,17 @@ def fund_to_response(fund) -> dict:
     }
 
 
+def fund_row_to_response(row) -> dict:
+    """Convert a FUND_LIST_SELECT row to response dict."""
+    data = dict(row._mapping)
+    for key in FUND_FLOAT_FIELDS:
+        data[key] = as_float(data[key])
+    # group_concat order is unspecified; sort like fund_to_response does
+    data["strategies"] = sorted(data["strategies"].split(",")) if data["strategies"] else []
+    data["sectors"] = sorted(data["sectors"].split(",")) if data["sectors"] else []
+    return data
+
+
 def gp_to_response(gp, fund_count: int = None) -> dict:
     """Convert GP model to response dict."""
     return {
@@ -57,7 +287,7 @@ def gp_to_response(gp, fund_count: int = None) -> dict:
         "city": gp.city,
         "country": gp.country,
         "institution_type": gp.institution_type.name if gp.institution_type else None,
-        "aum_usd": float(gp.aum_usd) if gp.aum_usd else None,
+        "aum_usd": as_float(gp.aum_usd),
         "aum_raw": gp.aum_raw,
         "fund_count": fund_count,
         "created_at": gp.created_at,
@@ -73,13 +303,56 @@ def lp_to_response(lp) -> dict:
         "city": lp.city,
         "country": lp.country,
         "institution_type": lp.institution_type.name if lp.institution_type else None,
-        "aum_usd": float(lp.aum_usd) if lp.aum_usd else None,
+        "aum_usd": as_float(lp.aum_usd),
         "aum_raw": lp.aum_raw,
         "created_at": lp.created_at,
         "updated_at": lp.updated_at,
     }
 
 
+# In-process TTL cache for near-static payloads (stats, lookup tables and
+# NLQ SQL translations): key -> (expires at, value)
+STATS_CACHE_TTL_SECONDS = 60
+META_CACHE_TTL_SECONDS = 3600
+NLQ_SQL_CACHE_TTL_SECONDS = 86400
+RESPONSE_CACHE_MAX_ENTRIES = 1024
+_RESPONSE_CACHE: dict = {}
+_RESPONSE_CACHE_LOCK = threading.Lock()
+
+
+def cache_get(key: str):
+    """Return the cached value for key, or None if it is missing or expired."""
+    entry = _RESPONSE_CACHE.get(key)
+    if entry is not None and entry[0] > time.monotonic():
+        return entry[1]
+    return None
+
+
+def cache_set(key: str, ttl: float, value):
+    """Store value under key for ttl seconds, evicting the oldest entry once the cache is full."""
+    # Sync routes call this from threadpool workers; evict and insert as one step
+    with _RESPONSE_CACHE_LOCK:
+        _RESPONSE_CACHE.pop(key, None)
+        if len(_RESPONSE_CACHE) >= RESPONSE_CACHE_MAX_ENTRIES:
+            _RESPONSE_CACHE.pop(next(iter(_RESPONSE_CACHE), None), None)
+        _RESPONSE_CACHE[key] = (time.monotonic() + ttl, value)
+
+
+def cached_response(key: str, ttl: float, compute):
+    """Return the cached value for key, calling compute() again once it is older than ttl seconds."""
+    value = cache_get(key)
+    if value is None:
+        value = compute()
+        cache_set(key, ttl, value)
+    return value
+
+
+def reset_response_cache():
+    """Drop all cached stats/meta payloads and NLQ translations (for testing or after reloading the database)."""
+    with _RESPONSE_CACHE_LOCK:
+        _RESPONSE_CACHE.clear()
+
+
 # ============================================================================
 # Fund Endpoints
 # ============================================================================
@@ -101,65 +374,68 @@ def list_secondary_funds(
     irr_max: Optional[float] = None,
     sort_by: Optional[str] = Query("fund_name", description="Sort by: fund_name, vintage_year, fund_size_usd, irr, tvpi, dpi"),
     sort_direction: Optional[str] = Query("asc", description="Sort direction: asc or desc"),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from a previous page's next_cursor; takes precedence over page"),
+    include_total: bool = Query(True, description="Return total and pages (runs a COUNT over the filtered rows); pass false to skip the COUNT and rely on has_more"),
     db: Session = Depends(get_secondary_db)
 ):
     """List secondary funds with filters."""
-    query = db.query(SecondaryFund)
+    conditions = []
 
-    # Apply filters
+    # Apply filters (GP and status are already joined in FUND_LIST_FROM)
     if search:
-        query = query.filter(SecondaryFund.fund_name.ilike(f"%{search}%"))
+        conditions.append(name_contains(SecondaryFund, SecondaryFund.fund_name, "fund_name_trgm", search))
 
     if fund_manager_name:
-        query = query.join(SecondaryGP).filter(SecondaryGP.institution_name.ilike(f"%{fund_manager_name}%"))
+        conditions.append(name_contains(SecondaryGP, SecondaryGP.institution_name, "gp_name_trgm", fund_manager_name))
 
     if status:
-        query = query.join(FundStatus).filter(FundStatus.code == status.value)
+        conditions.append(FundStatus.code == status.value)
 
     if strategy:
-        query = query.join(FundStrategy).join(Strategy).filter(Strategy.code == strategy.value)
+        conditions.append(SecondaryFund.strategies.any(FundStrategy.strategy.has(code=strategy.value)))
 
     if sector:
-        query = query.join(FundSector).join(Sector).filter(Sector.code == sector.value)
+        conditions.append(SecondaryFund.sectors.any(FundSector.sector.has(code=sector.value)))
 
     if vintage_year_min:
-        query = query.filter(SecondaryFund.vintage_year >= vintage_year_min)
+        conditions.append(SecondaryFund.vintage_year >= vintage_year_min)
     if vintage_year_max:
-        query = query.filter(SecondaryFund.vintage_year <= vintage_year_max)
+        conditions.append(SecondaryFund.vintage_year <= vintage_year_max)
 
     if fund_size_min:
-        query = query.filter(SecondaryFund.fund_size_usd >= fund_size_min)
+        conditions.append(SecondaryFund.fund_size_usd >= fund_size_min)
     if fund_size_max:
-        query = query.filter(SecondaryFund.fund_size_usd <= fund_size_max)
+        conditions.append(SecondaryFund.fund_size_usd <= fund_size_max)
 
     if irr_min:
-        query = query.filter(SecondaryFund.irr >= irr_min)
+        conditions.append(SecondaryFund.irr >= irr_min)
     if irr_max:
-        query = query.filter(SecondaryFund.irr <= irr_max)
-
-    # Get total count
-    total = query.count()
-
-    # Apply sorting
-    sort_column = getattr(SecondaryFund, sort_by, SecondaryFund.fund_name)
-    if sort_direction == "desc":
-        query = query.order_by(sort_column.desc())
-    else:
-        query = query.order_by(sort_column.asc())
-
-    # Apply pagination
-    offset = (page - 1) * page_size
-    funds = query.offset(offset).limit(page_size).all()
+        conditions.append(SecondaryFund.irr <= irr_max)
+
+    # Get total count (skipped with include_total=false; has_more comes from the page fetch)
+    total = db.execute(
+        select(func.count(SecondaryFund.id)).select_from(FUND_LIST_FROM).where(*conditions)
+    ).scalar() if include_total else None
+
+    # Apply sorting and pagination
+    sort_by, sort_direction = normalize_sort(FUND_SORT_COLUMNS, sort_by, sort_direction)
+    funds, next_cursor = paginate(
+        FUND_LIST_TEMPLATES[sort_by, sort_direction].where(*conditions), SecondaryFund, FUND_SORT_COLUMNS,
+        sort_by, sort_direction, page, page_size, cursor,
+        fetch=lambda stmt: db.execute(stmt).all(), ordered=True
+    )
 
-    pages = (total + page_size - 1) // page_size
+    pages = (total + page_size - 1) // page_size if include_total else None
 
-    return SecondaryFundListResponse(
-        items=[SecondaryFundResponse(**fund_to_response(f)) for f in funds],
+    return orjson_response(SECONDARY_FUND_LIST_RESPONSE_ADAPTER, SecondaryFundListResponse.model_construct(
+        items=[SecondaryFundResponse.model_construct(**fund_row_to_response(f)) for f in funds],
         total=total,
         page=page,
         page_size=page_size,
-        pages=pages
-    )
+        pages=pages,
+        next_cursor=next_cursor,
+        has_more=next_cursor is not None
+    ))
 
 
 @router.get("/funds/{fund_id}", response_model=SecondaryFundResponse)
@@ -185,13 +461,15 @@ def list_secondary_gps(
     aum_max: Optional[float] = None,
     sort_by: Optional[str] = Query("institution_name", description="Sort by: institution_name, aum_usd, country"),
     sort_direction: Optional[str] = Query("asc", description="Sort direction: asc or desc"),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from a previous page's next_cursor; takes precedence over page"),
+    include_total: bool = Query(True, description="Return total and pages (runs a COUNT over the filtered rows); pass false to skip the COUNT and rely on has_more"),
     db: Session = Depends(get_secondary_db)
 ):
     """List secondary fund GPs with filters."""
     query = db.query(SecondaryGP)
 
     if search:
-        query = query.filter(SecondaryGP.institution_name.ilike(f"%{search}%"))
+        query = query.filter(name_contains(SecondaryGP, SecondaryGP.institution_name, "gp_name_trgm", search))
 
     if country:
         query = query.filter(SecondaryGP.country.ilike(f"%{country}%"))
@@ -201,45 +479,39 @@ def list_secondary_gps(
     if aum_max:
         query = query.filter(SecondaryGP.aum_usd <= aum_max)
 
-    total = query.count()
+    total = query.count() if include_total else None
 
-    sort_column = getattr(SecondaryGP, sort_by, SecondaryGP.institution_name)
-    if sort_direction == "desc":
-        query = query.order_by(sort_column.desc())
-    else:
-        query = query.order_by(sort_column.asc())
-
-    offset = (page - 1) * page_size
-    gps = query.offset(offset).limit(page_size).all()
-
-    # Get fund counts for each GP
-    gp_ids = [gp.id for gp in gps]
-    fund_counts = dict(
-        db.query(SecondaryFund.gp_id, func.count(SecondaryFund.id))
-        .filter(SecondaryFund.gp_id.in_(gp_ids))
-        .group_by(SecondaryFund.gp_id)
-        .all()
+    # Fund counts come back with the page as a correlated subquery column
+    gps, next_cursor = paginate(
+        query.options(undefer(SecondaryGP.fund_count)), SecondaryGP, GP_SORT_COLUMNS,
+        sort_by, sort_direction, page, page_size, cursor
     )
 
-    pages = (total + page_size - 1) // page_size
+    pages = (total + page_size - 1) // page_size if include_total else None
 
-    return SecondaryGPListResponse(
-        items=[SecondaryGPResponse(**gp_to_response(gp, fund_counts.get(gp.id, 0))) for gp in gps],
+    return orjson_response(SECONDARY_GP_LIST_RESPONSE_ADAPTER, SecondaryGPListResponse.model_construct(
+        items=[SecondaryGPResponse.model_construct(**gp_to_response(gp, gp.fund_count)) for gp in gps],
         total=total,
         page=page,
         page_size=page_size,
-        pages=pages
-    )
+        pages=pages,
+        next_cursor=next_cursor,
+        has_more=next_cursor is not None
+    ))
 
 
 @router.get("/gps/{gp_id}", response_model=SecondaryGPResponse)
 def get_secondary_gp(gp_id: int, db: Session = Depends(get_secondary_db)):
     """Get a specific GP by ID."""
-    gp = db.query(SecondaryGP).filter(SecondaryGP.id == gp_id).first()
+    gp = (
+        db.query(SecondaryGP)
+        .options(undefer(SecondaryGP.fund_count))
+        .filter(SecondaryGP.id == gp_id)
+        .first()
+    )
     if not gp:
         raise HTTPException(status_code=404, detail="GP not found")
-    fund_count = db.query(func.count(SecondaryFund.id)).filter(SecondaryFund.gp_id == gp_id).scalar()
-    return SecondaryGPResponse(**gp_to_response(gp, fund_count))
+    return SecondaryGPResponse(**gp_to_response(gp, gp.fund_count))
 
 
 @router.get("/gps/{gp_id}/funds", response_model=SecondaryFundListResponse)
@@ -250,24 +522,36 @@ def get_gp_funds(
     db: Session = Depends(get_secondary_db)
 ):
     """Get funds managed by a specific GP."""
-    gp = db.query(SecondaryGP).filter(SecondaryGP.id == gp_id).first()
-    if not gp:
+    # GP existence and its fund count in one round-trip
+    gp_exists, total = db.execute(select(
+        select(SecondaryGP.id).where(SecondaryGP.id == gp_id).exists(),
+        select(func.count()).select_from(SecondaryFund).where(SecondaryFund.gp_id == gp_id).scalar_subquery(),
+    )).one()
+    if not gp_exists:
         raise HTTPException(status_code=404, detail="GP not found")
 
-    query = db.query(SecondaryFund).filter(SecondaryFund.gp_id == gp_id)
-    total = query.count()
-
+    # Ordered by id so pages are stable; idx_secondary_fund_gp (gp_id, rowid) serves it
     offset = (page - 1) * page_size
-    funds = query.offset(offset).limit(page_size).all()
+    funds = (
+        db.query(SecondaryFund)
+        .options(*FUND_LOADER_OPTIONS)
+        .filter(SecondaryFund.gp_id == gp_id)
+        .order_by(SecondaryFund.id)
+        .offset(offset)
+        .limit(page_size)
+        .all()
+    ) if offset < total else []
     pages = (total + page_size - 1) // page_size
+    has_more = offset + len(funds) < total
 
-    return SecondaryFundListResponse(
-        items=[SecondaryFundResponse(**fund_to_response(f)) for f in funds],
+    return orjson_response(SECONDARY_FUND_LIST_RESPONSE_ADAPTER, SecondaryFundListResponse.model_construct(
+        items=[SecondaryFundResponse.model_construct(**fund_to_response(f)) for f in funds],
         total=total,
         page=page,
         page_size=page_size,
-        pages=pages
-    )
+        pages=pages,
+        has_more=has_more
+    ))
 
 
 # ============================================================================
@@ -284,13 +568,15 @@ def list_secondary_lps(
     aum_max: Optional[float] = None,
     sort_by: Optional[str] = Query("institution_name", description="Sort by: institution_name, aum_usd, country"),
     sort_direction: Optional[str] = Query("asc", description="Sort direction: asc or desc"),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from a previous page's next_cursor; takes precedence over page"),
+    include_total: bool = Query(True, description="Return total and pages (runs a COUNT over the filtered rows); pass false to skip the COUNT and rely on has_more"),
     db: Session = Depends(get_secondary_db)
 ):
     """List secondary fund LPs with filters."""
     query = db.query(SecondaryLP)
 
     if search:
-        query = query.filter(SecondaryLP.institution_name.ilike(f"%{search}%"))
+        query = query.filter(name_contains(SecondaryLP, SecondaryLP.institution_name, "lp_name_trgm", search))
 
     if country:
         query = query.filter(SecondaryLP.country.ilike(f"%{country}%"))
@@ -300,26 +586,23 @@ def list_secondary_lps(
     if aum_max:
         query = query.filter(SecondaryLP.aum_usd <= aum_max)
 
-    total = query.count()
+    total = query.count() if include_total else None
 
-    sort_column = getattr(SecondaryLP, sort_by, SecondaryLP.institution_name)
-    if sort_direction == "desc":
-        query = query.order_by(sort_column.desc())
-    else:
-        query = query.order_by(sort_column.asc())
-
-    offset = (page - 1) * page_size
-    lps = query.offset(offset).limit(page_size).all()
+    lps, next_cursor = paginate(
+        query, SecondaryLP, LP_SORT_COLUMNS, sort_by, sort_direction, page, page_size, cursor
+    )
 
-    pages = (total + page_size - 1) // page_size
+    pages = (total + page_size - 1) // page_size if include_total else None
 
-    return SecondaryLPListResponse(
-        items=[SecondaryLPResponse(**lp_to_response(lp)) for lp in lps],
+    return orjson_response(SECONDARY_LP_LIST_RESPONSE_ADAPTER, SecondaryLPListResponse.model_construct(
+        items=[SecondaryLPResponse.model_construct(**lp_to_response(lp)) for lp in lps],
         total=total,
         page=page,
         page_size=page_size,
-        pages=pages
-    )
+        pages=pages,
+        next_cursor=next_cursor,
+        has_more=next_cursor is not None
+    ))
 
 
 @router.get("/lps/{lp_id}", response_model=SecondaryLPResponse)
@@ -338,41 +621,46 @@ def get_secondary_lp(lp_id: int, db: Session = Depends(get_secondary_db)):
 @router.get("/stats", response_model=SecondaryStatsResponse)
 def get_secondary_stats(db: Session = Depends(get_secondary_db)):
     """Get aggregate statistics for secondary funds database."""
-    total_funds = db.query(func.count(SecondaryFund.id)).scalar()
-    total_gps = db.query(func.count(SecondaryGP.id)).scalar()
-    total_lps = db.query(func.count(SecondaryLP.id)).scalar()
-
-    total_aum_gps = db.query(func.sum(SecondaryGP.aum_usd)).scalar()
-    total_aum_lps = db.query(func.sum(SecondaryLP.aum_usd)).scalar()
-
-    # Funds by status
-    status_counts = db.query(FundStatus.name, func.count(SecondaryFund.id))\
-        .join(SecondaryFund)\
-        .group_by(FundStatus.name)\
-        .all()
-    funds_by_status = {s[0]: s[1] for s in status_counts}
-
-    # Funds by strategy
-    strategy_counts = db.query(Strategy.code, func.count(FundStrategy.fund_id))\
-        .join(FundStrategy)\
-        .group_by(Strategy.code)\
-        .all()
-    funds_by_strategy = {s[0]: s[1] for s in strategy_counts}
-
-    # Funds by sector
-    sector_counts = db.query(Sector.code, func.count(FundSector.fund_id))\
-        .join(FundSector)\
-        .group_by(Sector.code)\
-        .all()
-    funds_by_sector = {s[0]: s[1] for s in sector_counts}
-
-    # Performance averages
-    avg_fund_size = db.query(func.avg(SecondaryFund.fund_size_usd))\
-        .filter(SecondaryFund.fund_size_usd.isnot(None)).scalar()
-    avg_irr = db.query(func.avg(SecondaryFund.irr))\
-        .filter(SecondaryFund.irr.isnot(None)).scalar()
-    avg_tvpi = db.query(func.avg(SecondaryFund.tvpi))\
-        .filter(SecondaryFund.tvpi.isnot(None)).scalar()
+    return cached_response("stats", STATS_CACHE_TTL_SECONDS, lambda: compute_secondary_stats(db))
+
+
+def compute_secondary_stats(db: Session) -> SecondaryStatsResponse:
+    """Run the aggregate queries behind the stats endpoint."""
+    # All scalar aggregates in one round trip; AVG already skips NULLs
+    (
+        total_funds, avg_fund_size, avg_irr, avg_tvpi,
+        total_gps, total_aum_gps, total_lps, total_aum_lps,
+    ) = db.execute(
+        select(
+            func.count(SecondaryFund.id),
+            func.avg(SecondaryFund.fund_size_usd),
+            func.avg(SecondaryFund.irr),
+            func.avg(SecondaryFund.tvpi),
+            select(func.count(SecondaryGP.id)).scalar_subquery(),
+            select(func.sum(SecondaryGP.aum_usd)).scalar_subquery(),
+            select(func.count(SecondaryLP.id)).scalar_subquery(),
+            select(func.sum(SecondaryLP.aum_usd)).scalar_subquery(),
+        )
+    ).one()
+
+    # Fund counts by status, strategy and sector in a second round trip,
+    # tagged with the breakdown they belong to
+    breakdowns = {"status": {}, "strategy": {}, "sector": {}}
+    breakdown_rows = db.execute(
+        union_all(
+            select(literal("status"), FundStatus.name, func.count(SecondaryFund.id))
+            .join_from(FundStatus, SecondaryFund)
+            .group_by(FundStatus.name),
+            select(literal("strategy"), Strategy.code, func.count(FundStrategy.fund_id))
+            .join_from(Strategy, FundStrategy)
+            .group_by(Strategy.code),
+            select(literal("sector"), Sector.code, func.count(FundSector.fund_id))
+            .join_from(Sector, FundSector)
+            .group_by(Sector.code),
+        )
+    )
+    for dimension, key, count in breakdown_rows:
+        breakdowns[dimension][key] = count
 
     return SecondaryStatsResponse(
         total_funds=total_funds,
@@ -380,9 +668,9 @@ def get_secondary_stats(db: Session = Depends(get_secondary_db)):
         total_lps=total_lps,
         total_aum_gps=float(total_aum_gps) if total_aum_gps else None,
         total_aum_lps=float(total_aum_lps) if total_aum_lps else None,
-        funds_by_status=funds_by_status,
-        funds_by_strategy=funds_by_strategy,
-        funds_by_sector=funds_by_sector,
+        funds_by_status=breakdowns["status"],
+        funds_by_strategy=breakdowns["strategy"],
+        funds_by_sector=breakdowns["sector"],
         avg_fund_size=float(avg_fund_size) if avg_fund_size else None,
         avg_irr=float(avg_irr) if avg_irr else None,
         avg_tvpi=float(avg_tvpi) if avg_tvpi else None,
@@ -396,70 +684,58 @@ def get_secondary_stats(db: Session = Depends(get_secondary_db)):
 @router.get("/meta/statuses")
 def get_fund_statuses(db: Session = Depends(get_secondary_db)):
     """Get all fund statuses."""
-    statuses = db.query(FundStatus).all()
-    return {"statuses": [{"code": s.code, "name": s.name} for s in statuses]}
+    return cached_response("meta:statuses", META_CACHE_TTL_SECONDS, lambda: {
+        "statuses": [{"code": s.code, "name": s.name} for s in db.query(FundStatus).all()]
+    })
 
 
 @router.get("/meta/strategies")
 def get_strategies(db: Session = Depends(get_secondary_db)):
     """Get all investment strategies."""
-    strategies = db.query(Strategy).all()
-    return {"strategies": [{"code": s.code, "name": s.name} for s in strategies]}
+    return cached_response("meta:strategies", META_CACHE_TTL_SECONDS, lambda: {
+        "strategies": [{"code": s.code, "name": s.name} for s in db.query(Strategy).all()]
+    })
 
 
 @router.get("/meta/sectors")
 def get_sectors(db: Session = Depends(get_secondary_db)):
     """Get all investment sectors."""
-    sectors = db.query(Sector).all()
-    return {"sectors": [{"code": s.code, "name": s.name} for s in sectors]}
+    return cached_response("meta:sectors", META_CACHE_TTL_SECONDS, lambda: {
+        "sectors": [{"code": s.code, "name": s.name} for s in db.query(Sector).all()]
+    })
 
 
 # ============================================================================
 # NLQ Endpoint
 # ============================================================================
 
-@router.post("/nlq", response_model=NLQResponse)
-def natural_language_query(request: NLQRequest, db: Session = Depends(get_secondary_db)):
-    """Execute a natural language query against the secondary funds database."""
-    try:
-        import openai
+# Most rows an NLQ response returns, whatever LIMIT the generated SQL has
+NLQ_MAX_ROWS = 100
 
-        openai_api_key = os.getenv("OPENAI_API_KEY")
-        if not openai_api_key:
-            raise HTTPException(status_code=500, detail="OpenAI API key not configured")
 
-        # Get database schema for context
-        schema_info = """
-        Tables:
-        - fund: id, fund_name, gp_id, status_id, vintage_year, fund_close_year, fund_size_usd, dpi, tvpi, irr
-        - gp: id, institution_name, city, country, aum_usd
-        - lp: id, institution_name, city, country, aum_usd
-        - fund_status: id, code (CLOSED, CLOSED_ENDED_IN_MARKET, OPEN_ENDED_IN_MARKET), name
-        - strategy: id, code (LP_STAKES, GP_LED, DIRECT_SECONDARIES, PREFERRED_EQUITY), name
-        - sector: id, code (PRIVATE_EQUITY, VENTURE_CAPITAL, REAL_ESTATE, INFRASTRUCTURE, PRIVATE_DEBT, AGRICULTURE), name
-        - fund_strategy: fund_id, strategy_id
-        - fund_sector: fund_id, sector_id
-
-        Performance metrics:
-        - IRR: Internal Rate of Return (percentage)
-        - TVPI: Total Value to Paid-In (multiple)
-        - DPI: Distributed to Paid-In (multiple)
-        - AUM: Assets Under Management (in USD millions)
-        """
-
-        client = openai.OpenAI(api_key=openai_api_key)
+# Database schema given to the model as context
+NLQ_SCHEMA_INFO = """
+Tables:
+- fund: id, fund_name, gp_id, status_id, vintage_year, fund_close_year, fund_size_usd, dpi, tvpi, irr
+- gp: id, institution_name, city, country, aum_usd
+- lp: id, institution_name, city, country, aum_usd
+- fund_status: id, code (CLOSED, CLOSED_ENDED_IN_MARKET, OPEN_ENDED_IN_MARKET), name
+- strategy: id, code (LP_STAKES, GP_LED, DIRECT_SECONDARIES, PREFERRED_EQUITY), name
+- sector: id, code (PRIVATE_EQUITY, VENTURE_CAPITAL, REAL_ESTATE, INFRASTRUCTURE, PRIVATE_DEBT, AGRICULTURE), name
+- fund_strategy: fund_id, strategy_id
+- fund_sector: fund_id, sector_id
 
-        start_time = time.time()
+Performance metrics:
+- IRR: Internal Rate of Return (percentage)
+- TVPI: Total Value to Paid-In (multiple)
+- DPI: Distributed to Paid-In (multiple)
+- AUM: Assets Under Management (in USD millions)
+"""
 
-        response = client.chat.completions.create(
-            model="gpt-4-turbo-preview",
-            messages=[
-                {
-                    "role": "system",
-                    "content": f"""You are a SQL expert. Convert natural language questions to SQLite SQL queries.
+NLQ_SYSTEM_PROMPT = f"""You are a SQL expert. Convert natural language questions to SQLite SQL queries.
 
 Database schema:
-{schema_info}
+{NLQ_SCHEMA_INFO}
 
 Rules:
 - Return ONLY the SQL query, no explanations
@@ -467,7 +743,87 @@ Rules:
 - Limit results to 100 rows
 - Use proper JOINs when querying across tables
 - For fund performance queries, filter for non-null values"""
-                },
+
+# Shared OpenAI client, so NLQ requests reuse its HTTP connection pool
+_nlq_client = None
+
+
+def get_nlq_client(api_key: str):
+    """Return the shared AsyncOpenAI client, creating it on first use."""
+    global _nlq_client
+    if _nlq_client is None:
+        import openai
+
+        _nlq_client = openai.AsyncOpenAI(api_key=api_key)
+    return _nlq_client
+
+
+def ensure_select_only(sql: str) -> str:
+    """Reject generated SQL that is not a single SELECT (or WITH ... SELECT) statement."""
+    statement = sql.strip().rstrip(";").strip()
+    if ";" in statement:
+        raise ValueError("Generated SQL must be a single statement")
+    keyword = statement.split(None, 1)[0].upper() if statement else ""
+    if keyword not in ("SELECT", "WITH"):
+        raise ValueError("Generated SQL must be a SELECT query")
+    return statement
+
+
+def run_nlq_sql(sql: str) -> List[dict]:
+    """
+    Execute generated SQL on a short-lived session and return up to
+    NLQ_MAX_ROWS rows as dicts.
+
+    SQLite's query_only pragma is switched on for the duration, so even a
+    statement that slips past ensure_select_only cannot modify the database.
+    Rows are pulled with fetchmany, so SQLite stops stepping the statement
+    once the cap is reached rather than materializing the full result.
+    """
+    statement = ensure_select_only(sql)
+    with SessionLocal() as db:
+        db.execute(text("PRAGMA query_only = ON"))
+        try:
+            result = db.execute(text(statement))
+            columns = result.keys()
+            return [dict(zip(columns, row)) for row in result.fetchmany(NLQ_MAX_ROWS)]
+        finally:
+            db.execute(text("PRAGMA query_only = OFF"))
+
+
+@router.post("/nlq", response_model=NLQResponse)
+async def natural_language_query(request: NLQRequest):
+    """
+    Execute a natural language query against the secondary funds database.
+
+    The OpenAI call is awaited without holding a database connection or a
+    worker thread; a session is only opened, in the threadpool, to run the
+    generated SQL.
+    """
+    try:
+        openai_api_key = os.getenv("OPENAI_API_KEY")
+        if not openai_api_key:
+            raise HTTPException(status_code=500, detail="OpenAI API key not configured")
+
+        start_time = time.time()
+
+        # Repeat questions reuse the SQL generated the first time. Only runs of
+        # whitespace are normalized: case can matter to the generated SQL
+        # (e.g. quoted names compared with =), so it is kept in the key.
+        cache_key = "nlq:sql:" + hashlib.sha256(" ".join(request.question.split()).encode()).hexdigest()
+        sql = cache_get(cache_key)
+        if sql is not None:
+            results = await run_in_threadpool(run_nlq_sql, sql)
+            return NLQResponse(
+                question=request.question,
+                sql=sql,
+                results=results,
+                execution_time=time.time() - start_time
+            )
+
+        response = await get_nlq_client(openai_api_key).chat.completions.create(
+            model="gpt-4-turbo-preview",
+            messages=[
+                {"role": "system", "content": NLQ_SYSTEM_PROMPT},
                 {"role": "user", "content": request.question}
             ],
             temperature=0
@@ -483,14 +839,12 @@ Rules:
             sql = sql.strip()
 
         # Execute the query
-        result = db.execute(text(sql))
-        columns = result.keys()
-        rows = result.fetchall()
+        results = await run_in_threadpool(run_nlq_sql, sql)
+        # Only cache SQL that actually ran
+        cache_set(cache_key, NLQ_SQL_CACHE_TTL_SECONDS, sql)
 
         execution_time = time.time() - start_time
 
-        results = [dict(zip(columns, row)) for row in rows]
-
         return NLQResponse(
             question=request.question,
             sql=sql,
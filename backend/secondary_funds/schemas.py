@@ -1,7 +1,7 @@
 """Pydantic schemas for secondary funds endpoints."""
 from typing import Optional, List
 from datetime import datetime, date
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 from enum import Enum
 
 
@@ -45,10 +45,16 @@ class SecondaryGPResponse(BaseModel):
 
 class SecondaryGPListResponse(BaseModel):
     items: List[SecondaryGPResponse]
-    total: int
+    total: Optional[int] = None  # None when the client passes include_total=false
     page: int
     page_size: int
-    pages: int
+    pages: Optional[int] = None
+    next_cursor: Optional[str] = None
+    has_more: bool = False
+
+
+# Serializes a whole page for orjson rendering
+SECONDARY_GP_LIST_RESPONSE_ADAPTER = TypeAdapter(SecondaryGPListResponse)
 
 
 # LP Schemas
@@ -68,10 +74,16 @@ class SecondaryLPResponse(BaseModel):
 
 class SecondaryLPListResponse(BaseModel):
     items: List[SecondaryLPResponse]
-    total: int
+    total: Optional[int] = None  # None when the client passes include_total=false
     page: int
     page_size: int
-    pages: int
+    pages: Optional[int] = None
+    next_cursor: Optional[str] = None
+    has_more: bool = False
+
+
+# Serializes a whole page for orjson rendering
+SECONDARY_LP_LIST_RESPONSE_ADAPTER = TypeAdapter(SecondaryLPListResponse)
 
 
 # Fund Schemas
@@ -103,10 +115,16 @@ class SecondaryFundResponse(BaseModel):
 
 class SecondaryFundListResponse(BaseModel):
     items: List[SecondaryFundResponse]
-    total: int
+    total: Optional[int] = None  # None when the client passes include_total=false
     page: int
     page_size: int
-    pages: int
+    pages: Optional[int] = None
+    next_cursor: Optional[str] = None
+    has_more: bool = False
+
+
+# Serializes a whole page for orjson rendering
+SECONDARY_FUND_LIST_RESPONSE_ADAPTER = TypeAdapter(SecondaryFundListResponse)
 
 
 # Statistics Schemas
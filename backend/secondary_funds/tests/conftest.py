@@ -0,0 +1,52 @@
+"""
+Shared fixtures for the secondary funds tests: a throwaway SQLite database
+with the secondary funds schema.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from secondary_funds.database import Base
+from secondary_funds.models import FundStatus
+
+
+@pytest.fixture
+def secondary_engine(tmp_path):
+    """
+    Engine on an empty secondary funds database file with one fund status.
+
+    The pool holds a single connection, so connection-level state (such as
+    the query_only PRAGMA set by run_nlq_sql) is checked on the connection
+    that set it.
+    """
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'secondary_funds.db'}",
+        poolclass=StaticPool,
+        connect_args={"check_same_thread": False},
+    )
+    Base.metadata.create_all(engine)
+    with sessionmaker(bind=engine)() as db:
+        db.add(FundStatus(id=1, code="CLOSED", name="Closed"))
+        db.commit()
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def secondary_session_factory(secondary_engine):
+    """Session factory bound to the test database."""
+    return sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=secondary_engine)
+
+
+@pytest.fixture
+def secondary_db(secondary_session_factory):
+    """Session on the test database."""
+    with secondary_session_factory() as db:
+        yield db
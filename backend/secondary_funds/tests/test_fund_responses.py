@@ -0,0 +1,77 @@
+"""
+Tests that the Core fund list path (FUND_LIST_TEMPLATES + fund_row_to_response)
+builds the same fund dicts as the ORM path (fund_to_response) used elsewhere.
+"""
+
+import datetime
+
+import pytest
+
+from secondary_funds.models import (
+    FundSector, FundStrategy, SecondaryFund, SecondaryGP, Sector, Strategy
+)
+from secondary_funds.routes import (
+    FUND_LIST_TEMPLATES, FUND_LOADER_OPTIONS, fund_row_to_response, fund_to_response
+)
+
+
+@pytest.fixture
+def funds(secondary_db):
+    """Funds with and without a GP, integer-valued and NULL metrics, and several strategies/sectors each."""
+    secondary_db.add_all([
+        SecondaryGP(id=1, institution_name="Alpha Partners"),
+        Strategy(id=1, code="LP_STAKES", name="LP Stakes"),
+        Strategy(id=2, code="GP_LED", name="GP-Led"),
+        Strategy(id=3, code="DIRECT_SECONDARIES", name="Direct Secondaries"),
+        Sector(id=1, code="VENTURE_CAPITAL", name="Venture Capital"),
+        Sector(id=2, code="PRIVATE_EQUITY", name="Private Equity"),
+        Sector(id=3, code="INFRASTRUCTURE", name="Infrastructure"),
+    ])
+    secondary_db.add_all([
+        SecondaryFund(
+            id=1, fund_name="Fund A", gp_id=1, status_id=1, vintage_year=2019,
+            fund_size_usd=250, fund_size_raw="$250M", target_size_usd=300.5,
+            dpi=1, tvpi=1.45, irr=12, data_source="Filing",
+            last_reporting_date=datetime.date(2024, 6, 30),
+        ),
+        SecondaryFund(id=2, fund_name="Fund B", status_id=1),
+        SecondaryFund(id=3, fund_name="Fund C", gp_id=1, status_id=1, irr=-2.5),
+    ])
+    secondary_db.flush()
+    # Link rows inserted out of code order, so an unsorted aggregate would differ
+    secondary_db.add_all([
+        FundStrategy(fund_id=1, strategy_id=1),
+        FundStrategy(fund_id=1, strategy_id=3),
+        FundStrategy(fund_id=1, strategy_id=2),
+        FundSector(fund_id=1, sector_id=1),
+        FundSector(fund_id=1, sector_id=3),
+        FundSector(fund_id=1, sector_id=2),
+        FundStrategy(fund_id=3, strategy_id=2),
+        FundSector(fund_id=3, sector_id=1),
+    ])
+    secondary_db.commit()
+    secondary_db.expunge_all()
+    return secondary_db
+
+
+def test_core_rows_match_orm_responses(funds):
+    core = [fund_row_to_response(row) for row in funds.execute(FUND_LIST_TEMPLATES["fund_name", "asc"]).all()]
+    orm = [
+        fund_to_response(fund)
+        for fund in funds.query(SecondaryFund).options(*FUND_LOADER_OPTIONS).order_by(SecondaryFund.fund_name)
+    ]
+    assert core == orm
+
+
+def test_strategies_and_sectors_are_sorted(funds):
+    row = funds.execute(FUND_LIST_TEMPLATES["fund_name", "asc"]).first()
+    response = fund_row_to_response(row)
+    assert response["strategies"] == ["DIRECT_SECONDARIES", "GP_LED", "LP_STAKES"]
+    assert response["sectors"] == ["INFRASTRUCTURE", "PRIVATE_EQUITY", "VENTURE_CAPITAL"]
+
+
+def test_numeric_fields_are_floats_on_both_paths(funds):
+    row = funds.execute(FUND_LIST_TEMPLATES["fund_name", "asc"]).first()
+    orm_fund = funds.get(SecondaryFund, 1)
+    for response in (fund_row_to_response(row), fund_to_response(orm_fund)):
+        assert [type(response[key]) for key in ("fund_size_usd", "dpi", "irr")] == [float, float, float]
@@ -0,0 +1,171 @@
+"""
+Endpoint tests for the secondary funds, GP and LP list routes: keyset pages
+over NULL and tied sort keys, and the total/pages/has_more/next_cursor shape.
+"""
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from secondary_funds import secondary_funds_router
+from secondary_funds.database import get_secondary_db
+from secondary_funds.models import (
+    FundSector, FundStrategy, SecondaryFund, SecondaryGP, SecondaryLP, Sector, Strategy
+)
+
+# IRR per fund id: NULLs and repeated values, so pages cross both
+FUND_IRRS = {1: None, 2: 5.0, 3: None, 4: 5.0, 5: 12.5, 6: -3.0, 7: 5.0, 8: None, 9: 12.5, 10: 0.0}
+
+# AUM per GP/LP id, with the same mix of NULLs and ties
+AUMS = {1: 500.0, 2: None, 3: 500.0, 4: 1200.0, 5: None, 6: 80.5, 7: 500.0}
+
+
+@pytest.fixture
+def listing_db(secondary_db):
+    """GPs, LPs and funds (with strategies and sectors) whose sort keys include NULLs and ties."""
+    secondary_db.add_all([
+        Strategy(id=1, code="LP_STAKES", name="LP Stakes"),
+        Strategy(id=2, code="GP_LED", name="GP-Led"),
+        Sector(id=1, code="PRIVATE_EQUITY", name="Private Equity"),
+        Sector(id=2, code="VENTURE_CAPITAL", name="Venture Capital"),
+    ])
+    secondary_db.add_all(
+        SecondaryGP(id=gp_id, institution_name=f"GP {gp_id}", aum_usd=aum)
+        for gp_id, aum in AUMS.items()
+    )
+    secondary_db.add_all(
+        SecondaryLP(id=lp_id, institution_name=f"LP {lp_id}", aum_usd=aum)
+        for lp_id, aum in AUMS.items()
+    )
+    secondary_db.add_all(
+        SecondaryFund(id=fund_id, fund_name=f"Fund {fund_id}", gp_id=fund_id % 3 + 1, status_id=1, irr=irr)
+        for fund_id, irr in FUND_IRRS.items()
+    )
+    secondary_db.flush()
+    secondary_db.add_all([
+        FundStrategy(fund_id=2, strategy_id=1),
+        FundStrategy(fund_id=2, strategy_id=2),
+        FundSector(fund_id=2, sector_id=2),
+        FundSector(fund_id=5, sector_id=1),
+    ])
+    secondary_db.commit()
+    return secondary_db
+
+
+@pytest.fixture
+def client(listing_db, secondary_session_factory):
+    """Test client for the secondary funds router on the test database."""
+    app = FastAPI()
+    app.include_router(secondary_funds_router)
+
+    def override_get_secondary_db():
+        with secondary_session_factory() as db:
+            yield db
+
+    app.dependency_overrides[get_secondary_db] = override_get_secondary_db
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+def expected_ids(values: dict, descending: bool) -> list:
+    """Ids in SQLite order: NULLs first ascending, ties broken by id."""
+    ordered = sorted(values, key=lambda row_id: (values[row_id] is not None, values[row_id] or 0, row_id))
+    return ordered[::-1] if descending else ordered
+
+
+def walk_pages(client, path: str, **params) -> list:
+    """Follow next_cursor from the first page to the last, returning the items seen in order."""
+    seen, cursor = [], None
+    while True:
+        response = client.get(path, params={**params, **({"cursor": cursor} if cursor else {})})
+        assert response.status_code == 200
+        body = response.json()
+        assert len(body["items"]) <= params["page_size"]
+        assert body["has_more"] is (body["next_cursor"] is not None)
+        seen.extend(body["items"])
+        cursor = body["next_cursor"]
+        if cursor is None:
+            return seen
+
+
+class TestFundList:
+    """/funds is served from the Core FUND_LIST_TEMPLATES select."""
+
+    @pytest.mark.parametrize("sort_direction", ["asc", "desc"])
+    @pytest.mark.parametrize("page_size", [1, 3, 4, 10])
+    def test_cursor_pages_span_null_and_tied_irr(self, client, sort_direction, page_size):
+        items = walk_pages(client, "/api/secondary-funds/funds",
+                           sort_by="irr", sort_direction=sort_direction, page_size=page_size)
+        assert [item["id"] for item in items] == expected_ids(FUND_IRRS, sort_direction == "desc")
+        assert {item["id"]: item["irr"] for item in items} == FUND_IRRS
+
+    def test_items_carry_joined_and_aggregated_columns(self, client):
+        body = client.get("/api/secondary-funds/funds", params={"search": "Fund 2"}).json()
+        [fund] = body["items"]
+        assert fund["fund_manager_name"] == "GP 3"
+        assert fund["status"] == "Closed"
+        assert fund["strategies"] == ["GP_LED", "LP_STAKES"]
+        assert fund["sectors"] == ["VENTURE_CAPITAL"]
+
+    def test_total_and_pages_by_default(self, client):
+        body = client.get("/api/secondary-funds/funds", params={"page_size": 4}).json()
+        assert body["total"] == len(FUND_IRRS)
+        assert body["pages"] == 3
+        assert body["has_more"] is True
+        assert body["next_cursor"] is not None
+
+    def test_include_total_false_skips_count(self, client):
+        body = client.get("/api/secondary-funds/funds", params={"page_size": 4, "include_total": "false"}).json()
+        assert body["total"] is None
+        assert body["pages"] is None
+        assert len(body["items"]) == 4
+        assert body["has_more"] is True
+
+    def test_last_page_has_no_cursor(self, client):
+        body = client.get("/api/secondary-funds/funds", params={"page_size": 4, "page": 3}).json()
+        assert [item["id"] for item in body["items"]] == [8, 9]
+        assert body["has_more"] is False
+        assert body["next_cursor"] is None
+
+    def test_cursor_from_another_sort_is_rejected(self, client):
+        body = client.get("/api/secondary-funds/funds", params={"sort_by": "irr", "page_size": 2}).json()
+        response = client.get("/api/secondary-funds/funds",
+                              params={"sort_by": "vintage_year", "cursor": body["next_cursor"]})
+        assert response.status_code == 400
+
+
+@pytest.mark.parametrize("path", ["/api/secondary-funds/gps", "/api/secondary-funds/lps"])
+class TestInstitutionLists:
+    """/gps and /lps page through the ORM query the same way."""
+
+    @pytest.mark.parametrize("sort_direction", ["asc", "desc"])
+    @pytest.mark.parametrize("page_size", [1, 2, 3, 7])
+    def test_cursor_pages_span_null_and_tied_aum(self, client, path, sort_direction, page_size):
+        items = walk_pages(client, path, sort_by="aum_usd", sort_direction=sort_direction, page_size=page_size)
+        assert [item["id"] for item in items] == expected_ids(AUMS, sort_direction == "desc")
+        assert {item["id"]: item["aum_usd"] for item in items} == AUMS
+
+    def test_total_and_pages_by_default(self, client, path):
+        body = client.get(path, params={"page_size": 3}).json()
+        assert body["total"] == len(AUMS)
+        assert body["pages"] == 3
+        assert body["has_more"] is True
+        assert body["next_cursor"] is not None
+
+    def test_include_total_false_skips_count(self, client, path):
+        body = client.get(path, params={"page_size": 3, "include_total": "false"}).json()
+        assert body["total"] is None
+        assert body["pages"] is None
+        assert len(body["items"]) == 3
+        assert body["has_more"] is True
+
+    def test_last_page_has_no_cursor(self, client, path):
+        body = client.get(path, params={"page_size": 7}).json()
+        assert len(body["items"]) == len(AUMS)
+        assert body["has_more"] is False
+        assert body["next_cursor"] is None
+
+
+def test_gp_list_includes_fund_counts(client):
+    body = client.get("/api/secondary-funds/gps", params={"page_size": 7}).json()
+    assert {item["id"]: item["fund_count"] for item in body["items"]} == {1: 3, 2: 4, 3: 3, 4: 0, 5: 0, 6: 0, 7: 0}
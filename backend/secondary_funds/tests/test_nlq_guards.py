@@ -0,0 +1,111 @@
+"""
+Tests for the guards around executing LLM-generated NLQ SQL.
+"""
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+
+from secondary_funds import routes
+from secondary_funds.models import SecondaryFund
+from secondary_funds.routes import NLQ_MAX_ROWS, ensure_select_only, run_nlq_sql
+
+
+@pytest.fixture
+def nlq_db(secondary_session_factory, monkeypatch):
+    """Point run_nlq_sql at the test database, seeded with more funds than NLQ_MAX_ROWS."""
+    monkeypatch.setattr(routes, "SessionLocal", secondary_session_factory)
+    with secondary_session_factory() as db:
+        db.add_all(
+            SecondaryFund(id=fund_id, fund_name=f"Fund {fund_id}", status_id=1)
+            for fund_id in range(1, NLQ_MAX_ROWS + 51)
+        )
+        db.commit()
+    return secondary_session_factory
+
+
+def fund_count(session_factory) -> int:
+    with session_factory() as db:
+        return db.execute(text("SELECT COUNT(*) FROM fund")).scalar()
+
+
+class TestEnsureSelectOnly:
+    """Only a single SELECT (or WITH ... SELECT) statement gets through."""
+
+    @pytest.mark.parametrize("sql", [
+        "SELECT fund_name FROM fund LIMIT 10",
+        "  select fund_name from fund;  ",
+        "WITH top AS (SELECT id FROM fund) SELECT * FROM top",
+    ])
+    def test_accepts_select(self, sql):
+        assert ensure_select_only(sql) == sql.strip().rstrip(";").strip()
+
+    @pytest.mark.parametrize("sql", [
+        "DROP TABLE fund",
+        "DELETE FROM fund",
+        "UPDATE fund SET fund_name = 'x'",
+        "INSERT INTO fund (fund_name, status_id) VALUES ('x', 1)",
+        "PRAGMA query_only = OFF",
+        "ATTACH DATABASE 'other.db' AS other",
+        "",
+    ])
+    def test_rejects_non_select(self, sql):
+        with pytest.raises(ValueError):
+            ensure_select_only(sql)
+
+    @pytest.mark.parametrize("sql", [
+        "SELECT 1; DROP TABLE fund",
+        "SELECT 1;\nDELETE FROM fund;",
+        "PRAGMA query_only = OFF; SELECT 1",
+    ])
+    def test_rejects_multiple_statements(self, sql):
+        with pytest.raises(ValueError):
+            ensure_select_only(sql)
+
+    @pytest.mark.parametrize("sql", [
+        "SELECT 1 -- harmless\n; DROP TABLE fund",
+        "SELECT 1 /* harmless */; DROP TABLE fund",
+        "/* SELECT */ DROP TABLE fund",
+        "-- SELECT\nDELETE FROM fund",
+    ])
+    def test_rejects_comment_smuggled_statements(self, sql):
+        with pytest.raises(ValueError):
+            ensure_select_only(sql)
+
+
+class TestRunNlqSql:
+    """Generated SQL runs read-only and returns at most NLQ_MAX_ROWS rows."""
+
+    def test_returns_rows_as_dicts(self, nlq_db):
+        assert run_nlq_sql("SELECT id, fund_name FROM fund WHERE id = 1") == [{"id": 1, "fund_name": "Fund 1"}]
+
+    def test_truncates_at_max_rows(self, nlq_db):
+        results = run_nlq_sql("SELECT id FROM fund ORDER BY id")
+        assert len(results) == NLQ_MAX_ROWS
+        assert results[-1] == {"id": NLQ_MAX_ROWS}
+
+    def test_rejects_non_select_before_executing(self, nlq_db):
+        with pytest.raises(ValueError):
+            run_nlq_sql("DELETE FROM fund")
+        assert fund_count(nlq_db) == NLQ_MAX_ROWS + 50
+
+    @pytest.mark.parametrize("sql", [
+        "WITH doomed AS (SELECT id FROM fund) DELETE FROM fund WHERE id IN (SELECT id FROM doomed)",
+        "WITH new AS (SELECT 'Injected' AS name) INSERT INTO fund (fund_name, status_id) SELECT name, 1 FROM new",
+        "WITH doomed AS (SELECT id FROM fund) UPDATE fund SET fund_name = 'x' WHERE id IN (SELECT id FROM doomed)",
+    ])
+    def test_with_write_is_blocked_by_query_only(self, nlq_db, sql):
+        with pytest.raises(OperationalError, match="readonly"):
+            run_nlq_sql(sql)
+        assert fund_count(nlq_db) == NLQ_MAX_ROWS + 50
+        with nlq_db() as db:
+            assert db.execute(text("SELECT COUNT(*) FROM fund WHERE fund_name IN ('x', 'Injected')")).scalar() == 0
+
+    def test_query_only_is_reset_afterwards(self, nlq_db, secondary_engine):
+        with secondary_engine.connect() as conn:
+            dbapi_connection = conn.connection.dbapi_connection
+        run_nlq_sql("SELECT 1")
+        with nlq_db() as db:
+            conn = db.connection()
+            assert conn.connection.dbapi_connection is dbapi_connection
+            assert conn.execute(text("PRAGMA query_only")).scalar() == 0
@@ -0,0 +1,121 @@
+"""
+Tests for keyset (cursor) pagination of the secondary funds lists.
+"""
+
+import base64
+import json
+
+import pytest
+from fastapi import HTTPException
+
+from secondary_funds.models import SecondaryFund
+from secondary_funds.routes import FUND_SORT_COLUMNS, decode_cursor, encode_cursor, paginate
+
+# IRR per fund id: NULLs and repeated values, so pages cross both
+IRRS = {1: None, 2: 5.0, 3: None, 4: 5.0, 5: 12.5, 6: -3.0, 7: 5.0, 8: None, 9: 12.5, 10: 0.0}
+
+
+@pytest.fixture
+def funds(secondary_db):
+    """Ten funds whose IRRs include NULLs and ties."""
+    secondary_db.add_all(
+        SecondaryFund(id=fund_id, fund_name=f"Fund {fund_id}", status_id=1, irr=irr)
+        for fund_id, irr in IRRS.items()
+    )
+    secondary_db.commit()
+    return secondary_db
+
+
+def expected_ids(descending: bool) -> list:
+    """Fund ids in SQLite order: NULLs first ascending, ties broken by id."""
+    ordered = sorted(IRRS, key=lambda fund_id: (IRRS[fund_id] is not None, IRRS[fund_id] or 0, fund_id))
+    return ordered[::-1] if descending else ordered
+
+
+def walk_pages(db, sort_direction: str, page_size: int) -> list:
+    """Follow next_cursor from the first page to the last, returning the ids seen in order."""
+    seen, cursor = [], None
+    while True:
+        rows, cursor = paginate(
+            db.query(SecondaryFund), SecondaryFund, FUND_SORT_COLUMNS,
+            "irr", sort_direction, 1, page_size, cursor
+        )
+        assert len(rows) <= page_size
+        seen.extend(row.id for row in rows)
+        if cursor is None:
+            return seen
+
+
+def make_cursor(payload) -> str:
+    """Encode an arbitrary payload the way encode_cursor does."""
+    return base64.urlsafe_b64encode(json.dumps(payload).encode()).decode()
+
+
+class TestKeysetPages:
+    """Walking every page by cursor visits each row once, in sort order."""
+
+    @pytest.mark.parametrize("page_size", [1, 2, 3, 4, 10])
+    def test_ascending_pages_span_nulls_and_ties(self, funds, page_size):
+        assert walk_pages(funds, "asc", page_size) == expected_ids(descending=False)
+
+    @pytest.mark.parametrize("page_size", [1, 2, 3, 4, 10])
+    def test_descending_pages_span_nulls_and_ties(self, funds, page_size):
+        assert walk_pages(funds, "desc", page_size) == expected_ids(descending=True)
+
+    def test_ties_are_broken_by_id(self, funds):
+        """Funds 2, 4 and 7 share an IRR; a page boundary inside the tie must not skip or repeat one."""
+        ascending = walk_pages(funds, "asc", 2)
+        assert [fund_id for fund_id in ascending if IRRS[fund_id] == 5.0] == [2, 4, 7]
+        descending = walk_pages(funds, "desc", 2)
+        assert [fund_id for fund_id in descending if IRRS[fund_id] == 5.0] == [7, 4, 2]
+
+    def test_last_page_has_no_cursor(self, funds):
+        rows, cursor = paginate(
+            funds.query(SecondaryFund), SecondaryFund, FUND_SORT_COLUMNS,
+            "irr", "asc", 1, len(IRRS), None
+        )
+        assert len(rows) == len(IRRS)
+        assert cursor is None
+
+
+class TestDecodeCursor:
+    """Cursors that are malformed or do not match the request are rejected with 400."""
+
+    def test_round_trip(self):
+        cursor = encode_cursor("irr", "desc", 5.0, 7)
+        assert decode_cursor(cursor, "irr", "desc") == (5.0, 7)
+
+    def test_round_trip_null_value(self):
+        cursor = encode_cursor("irr", "asc", None, 3)
+        assert decode_cursor(cursor, "irr", "asc") == (None, 3)
+
+    @pytest.mark.parametrize("cursor", [
+        "not base64!",
+        base64.urlsafe_b64encode(b"not json").decode(),
+        base64.urlsafe_b64encode(b"\xff\xfe").decode(),
+        make_cursor([1, 2]),
+        make_cursor({"by": "irr", "dir": "asc", "v": 1.0}),
+        make_cursor({"by": "irr", "dir": "asc", "v": 1.0, "id": "seven"}),
+    ])
+    def test_malformed_cursor(self, cursor):
+        with pytest.raises(HTTPException) as exc_info:
+            decode_cursor(cursor, "irr", "asc")
+        assert exc_info.value.status_code == 400
+
+    @pytest.mark.parametrize("sort_by, sort_direction", [
+        ("vintage_year", "asc"),
+        ("irr", "desc"),
+        ("vintage_year", "desc"),
+    ])
+    def test_cursor_reused_with_other_sort(self, sort_by, sort_direction):
+        cursor = encode_cursor("irr", "asc", 5.0, 7)
+        with pytest.raises(HTTPException) as exc_info:
+            decode_cursor(cursor, sort_by, sort_direction)
+        assert exc_info.value.status_code == 400
+
+    @pytest.mark.parametrize("value", [[1, 2], {"a": 1}, True])
+    def test_non_scalar_value(self, value):
+        cursor = make_cursor({"by": "irr", "dir": "asc", "v": value, "id": 7})
+        with pytest.raises(HTTPException) as exc_info:
+            decode_cursor(cursor, "irr", "asc")
+        assert exc_info.value.status_code == 400
@@ -0,0 +1,3 @@
+"""
+Shared helpers with no dependency on the API or database layers
+"""
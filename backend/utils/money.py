@@ -0,0 +1,21 @@
+"""
+Money formatting shared by the API schemas and the database layer
+"""
+
+from typing import Optional
+
+_MONEY_UNITS = ((1_000_000_000, "B"), (1_000_000, "M"), (1_000, "K"))
+
+
+def format_money(amount: Optional[float]) -> Optional[str]:
+    """Format a USD amount as a display string (e.g., 2500000000.0 -> '$2.5B', -3e6 -> '-$3M')"""
+    if amount is None:
+        return None
+    sign = "-" if amount < 0 else ""
+    amount = abs(amount)
+    for unit, suffix in _MONEY_UNITS:
+        # Round before choosing the unit so 999_999_999 becomes '$1B', not '$1000M'
+        scaled = round(amount / unit, 2)
+        if scaled >= 1:
+            return f"{sign}${scaled:.2f}".rstrip("0").rstrip(".") + suffix
+    return f"{sign}${amount:,.0f}"
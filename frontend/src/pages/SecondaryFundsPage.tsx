@@ -21,15 +21,15 @@ export function SecondaryFundsPage() {
   const [activeTab, setActiveTab] = useState<TabType>('funds');
 
   // Funds tab state
-  const [fundsParams, setFundsParams] = useState<FundsParams>({ page: 1, page_size: 20 });
+  const [fundsParams, setFundsParams] = useState<FundsParams>({ page: 1, page_size: 20, include_total: true });
   const [fundsSearch, setFundsSearch] = useState('');
 
   // GPs tab state
-  const [gpsParams, setGpsParams] = useState<GPsParams>({ page: 1, page_size: 20 });
+  const [gpsParams, setGpsParams] = useState<GPsParams>({ page: 1, page_size: 20, include_total: true });
   const [gpsSearch, setGpsSearch] = useState('');
 
   // LPs tab state
-  const [lpsParams, setLpsParams] = useState<LPsParams>({ page: 1, page_size: 20 });
+  const [lpsParams, setLpsParams] = useState<LPsParams>({ page: 1, page_size: 20, include_total: true });
   const [lpsSearch, setLpsSearch] = useState('');
 
   // NLQ tab state
@@ -257,7 +257,7 @@ export function SecondaryFundsPage() {
               {fundsData && (
                 <div className="px-4 py-3 bg-slate-800 border-t border-slate-700/50 flex items-center justify-between">
                   <div className="text-sm text-slate-400">
-                    Showing {((fundsData.page - 1) * fundsData.page_size) + 1} to {Math.min(fundsData.page * fundsData.page_size, fundsData.total)} of {fundsData.total}
+                    Showing {((fundsData.page - 1) * fundsData.page_size) + 1} to {Math.min(fundsData.page * fundsData.page_size, fundsData.total ?? 0)} of {fundsData.total ?? 0}
                   </div>
                   <div className="flex items-center space-x-2">
                     <button
@@ -267,10 +267,10 @@ export function SecondaryFundsPage() {
                     >
                       <ChevronLeft className="w-4 h-4 text-white" />
                     </button>
-                    <span className="text-sm text-white">Page {fundsData.page} of {fundsData.pages}</span>
+                    <span className="text-sm text-white">Page {fundsData.page} of {fundsData.pages ?? 1}</span>
                     <button
                       onClick={() => setFundsParams(prev => ({ ...prev, page: (prev.page || 1) + 1 }))}
-                      disabled={fundsData.page >= fundsData.pages}
+                      disabled={!fundsData.has_more}
                       className="p-2 bg-slate-700 hover:bg-slate-600 disabled:opacity-50 disabled:cursor-not-allowed rounded-lg transition-colors"
                     >
                       <ChevronRight className="w-4 h-4 text-white" />
@@ -338,7 +338,7 @@ export function SecondaryFundsPage() {
               {gpsData && (
                 <div className="px-4 py-3 bg-slate-800 border-t border-slate-700/50 flex items-center justify-between">
                   <div className="text-sm text-slate-400">
-                    Showing {((gpsData.page - 1) * gpsData.page_size) + 1} to {Math.min(gpsData.page * gpsData.page_size, gpsData.total)} of {gpsData.total}
+                    Showing {((gpsData.page - 1) * gpsData.page_size) + 1} to {Math.min(gpsData.page * gpsData.page_size, gpsData.total ?? 0)} of {gpsData.total ?? 0}
                   </div>
                   <div className="flex items-center space-x-2">
                     <button
@@ -348,10 +348,10 @@ export function SecondaryFundsPage() {
                     >
                       <ChevronLeft className="w-4 h-4 text-white" />
                     </button>
-                    <span className="text-sm text-white">Page {gpsData.page} of {gpsData.pages}</span>
+                    <span className="text-sm text-white">Page {gpsData.page} of {gpsData.pages ?? 1}</span>
                     <button
                       onClick={() => setGpsParams(prev => ({ ...prev, page: (prev.page || 1) + 1 }))}
-                      disabled={gpsData.page >= gpsData.pages}
+                      disabled={!gpsData.has_more}
                       className="p-2 bg-slate-700 hover:bg-slate-600 disabled:opacity-50 disabled:cursor-not-allowed rounded-lg transition-colors"
                     >
                       <ChevronRight className="w-4 h-4 text-white" />
@@ -417,7 +417,7 @@ export function SecondaryFundsPage() {
               {lpsData && (
                 <div className="px-4 py-3 bg-slate-800 border-t border-slate-700/50 flex items-center justify-between">
                   <div className="text-sm text-slate-400">
-                    Showing {((lpsData.page - 1) * lpsData.page_size) + 1} to {Math.min(lpsData.page * lpsData.page_size, lpsData.total)} of {lpsData.total}
+                    Showing {((lpsData.page - 1) * lpsData.page_size) + 1} to {Math.min(lpsData.page * lpsData.page_size, lpsData.total ?? 0)} of {lpsData.total ?? 0}
                   </div>
                   <div className="flex items-center space-x-2">
                     <button
@@ -427,10 +427,10 @@ export function SecondaryFundsPage() {
                     >
                       <ChevronLeft className="w-4 h-4 text-white" />
                     </button>
-                    <span className="text-sm text-white">Page {lpsData.page} of {lpsData.pages}</span>
+                    <span className="text-sm text-white">Page {lpsData.page} of {lpsData.pages ?? 1}</span>
                     <button
                       onClick={() => setLpsParams(prev => ({ ...prev, page: (prev.page || 1) + 1 }))}
-                      disabled={lpsData.page >= lpsData.pages}
+                      disabled={!lpsData.has_more}
                       className="p-2 bg-slate-700 hover:bg-slate-600 disabled:opacity-50 disabled:cursor-not-allowed rounded-lg transition-colors"
                     >
                       <ChevronRight className="w-4 h-4 text-white" />
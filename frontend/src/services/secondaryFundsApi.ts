@@ -23,6 +23,8 @@ const API_BASE = '/api/secondary-funds';
 export interface FundsParams {
   page?: number;
   page_size?: number;
+  cursor?: string;
+  include_total?: boolean;
   search?: string;
   fund_manager_name?: string;
   status?: FundStatusFilter;
@@ -75,6 +77,8 @@ export function useSecondaryFund(id: number) {
 export interface GPsParams {
   page?: number;
   page_size?: number;
+  cursor?: string;
+  include_total?: boolean;
   search?: string;
   country?: string;
   aum_min?: number;
@@ -120,6 +124,8 @@ export function useSecondaryGP(id: number) {
 export interface LPsParams {
   page?: number;
   page_size?: number;
+  cursor?: string;
+  include_total?: boolean;
   search?: string;
   country?: string;
   aum_min?: number;
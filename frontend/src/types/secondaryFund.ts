@@ -53,26 +53,32 @@ export interface SecondaryLP {
 
 export interface SecondaryFundListResponse {
   items: SecondaryFund[];
-  total: number;
+  total: number | null; // null when requested with include_total=false
   page: number;
   page_size: number;
-  pages: number;
+  pages: number | null;
+  next_cursor: string | null; // Opaque keyset cursor for the following page
+  has_more: boolean;
 }
 
 export interface SecondaryGPListResponse {
   items: SecondaryGP[];
-  total: number;
+  total: number | null; // null when requested with include_total=false
   page: number;
   page_size: number;
-  pages: number;
+  pages: number | null;
+  next_cursor: string | null; // Opaque keyset cursor for the following page
+  has_more: boolean;
 }
 
 export interface SecondaryLPListResponse {
   items: SecondaryLP[];
-  total: number;
+  total: number | null; // null when requested with include_total=false
   page: number;
   page_size: number;
-  pages: number;
+  pages: number | null;
+  next_cursor: string | null; // Opaque keyset cursor for the following page
+  has_more: boolean;
 }
 
 export interface SecondaryStats {